@@ -32,15 +32,26 @@ import re
 import csv
 import json
 import time
+import shutil
+import asyncio
+import hashlib
+import functools
+import sqlite3
 import zipfile
 import argparse
+import operator
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from pathlib import Path
+from urllib.parse import urlparse
 from datetime import datetime
-from collections import defaultdict
-from typing import List, Dict, Optional
-from xml.etree import ElementTree as ET
+from email.utils import formatdate, parsedate_to_datetime
+from collections import Counter, deque
+from contextlib import ExitStack, contextmanager
+from typing import List, Dict, Optional, Tuple, Iterator, Iterable, Callable
 
 import requests
+from lxml import etree
 from requests.adapters import HTTPAdapter, Retry
 
 # Try to import PDF libraries
@@ -55,6 +66,91 @@ except ImportError:
     except ImportError:
         PYPDF2_AVAILABLE = False
 
+# Try to import async HTTP/2 client for eFetch (falls back to requests)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+    try:
+        import h2  # noqa: F401  (enables HTTP/2 in httpx)
+        HTTP2_AVAILABLE = True
+    except ImportError:
+        HTTP2_AVAILABLE = False
+except ImportError:
+    HTTPX_AVAILABLE = False
+    HTTP2_AVAILABLE = False
+
+# Try to import Arrow's multi-threaded CSV reader for loading abstracts
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Try to import faster JSON library (falls back to stdlib json, which also accepts bytes)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _json_loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _json_loads = json.loads
+
+# Try to import native sentence splitter for chunking long abstracts (falls back to a regex)
+try:
+    import blingfire
+    BLINGFIRE_AVAILABLE = True
+except ImportError:
+    BLINGFIRE_AVAILABLE = False
+
+# Precompiled patterns for filename sanitizing and JSON cleanup
+_SANITIZE_RE = re.compile(r'[^A-Za-z0-9_.-]+')
+_CTRL_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
+# Journal names and ISSNs inside a journal clause, used to route combined-search results
+_JOURNAL_NAME_RE = re.compile(r'"([^"]+)"\[Journal\]', re.I)
+_JOURNAL_ISSN_RE = re.compile(r'(\d{4}-\d{3}[\dX])\[ISSN\]', re.I)
+
+# Downloadable file links on the RadLex page (bytes pattern: scanned without decoding the page)
+_RADLEX_HREF_RE = re.compile(rb'href="(https?://[^"]+\.(?:owl|xlsx|json|zip))"', re.I)
+
+# Sentence boundaries used when splitting long abstracts into chunks (without blingfire)
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text into sentences (blingfire's native tokenizer when available, else punctuation + whitespace)"""
+    if BLINGFIRE_AVAILABLE:
+        return blingfire.text_to_sentences(text).split('\n')
+    return _SENT_SPLIT.split(text)
+
+
+def _list_files(directory: Path, suffix: str) -> List[Path]:
+    """Sorted regular files in directory ending with suffix (one scandir, no per-entry glob matching)"""
+    try:
+        with os.scandir(directory) as it:
+            return sorted(Path(e.path) for e in it if e.name.endswith(suffix) and e.is_file())
+    except FileNotFoundError:
+        return []
+
+
+@contextmanager
+def _atomic_open(path: Path, mode: str = 'wb', **kwargs):
+    """Open a sibling .tmp file for writing and rename it over path only if the block succeeds"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# (lowercased journal titles/ISSNs, CSV row) as produced by the eFetch parser
+ParsedArticle = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
 
 # ============================================================================
 # Configuration
@@ -75,7 +171,45 @@ class Config:
     NCBI_EMAIL = os.environ.get("NCBI_EMAIL", "your_email@example.com")
     NCBI_API_KEY = os.environ.get("NCBI_API_KEY")
     NCBI_TOOL = "OncologyImagingDownload"
-    BASE_DELAY = 0.34 if not NCBI_API_KEY else 0.12
+    # E-utilities allow 3 requests/s per client, 10 with an API key; requests are spaced at exactly that
+    NCBI_REQUESTS_PER_SEC = 10 if NCBI_API_KEY else 3
+    BASE_DELAY = 1.0 / NCBI_REQUESTS_PER_SEC
+    
+    # Concurrency (overall request rate is still capped by BASE_DELAY)
+    JOURNAL_WORKERS = 8
+    EFETCH_WORKERS = 4
+    DOWNLOAD_WORKERS = 4
+    DOWNLOADS_PER_HOST = 2
+    PDF_WORKERS = os.cpu_count() or 1
+    PDF_PAGES_PER_TASK = 16  # Smaller PDFs are extracted in-process
+    ABSTRACT_WORKERS = os.cpu_count() or 1
+    ABSTRACT_PARALLEL_MIN = 20000  # Smaller corpora are built in-process (pickling costs more than it saves)
+    ABSTRACT_TASK_SIZE = 256
+    
+    # Larger PDF downloads are refused before any bytes are written
+    MAX_PDF_BYTES = 500 * 1024 * 1024
+    
+    # PDF chunks: adjacent paragraphs on a page are merged up to this many characters
+    # (longer paragraphs are split at sentences); shorter merged chunks are dropped
+    PDF_CHUNK_MAX_CHARS = 1500
+    PDF_MIN_CHUNK_CHARS = 100
+    
+    # Times a 429 response is retried after honoring its Retry-After header
+    RATE_LIMIT_RETRIES = 5
+    
+    # eFetch paging and resume (20 pages x 500 = one 10k EPost set per checkpoint).
+    # Pages come off the history server, so page size is not bounded by URL length
+    EFETCH_BATCH_SIZE = 500
+    CHECKPOINT_EVERY = 20
+    
+    # eSearch PMID lists are cached on disk and refreshed after this many days; per-year lists
+    # for years that closed more than a year ago barely change, so they are kept longer
+    SEARCH_CACHE_MAX_AGE_DAYS = 30
+    SEARCH_CACHE_CLOSED_YEAR_DAYS = 365
+    
+    # Abstract chunk size for embedding, in estimated tokens (whitespace words x TOKENS_PER_WORD)
+    CHUNK_MAX_TOKENS = 512
+    TOKENS_PER_WORD = 1.3
     
     # URLs
     RADLEX_URL = "https://radlex.org/"
@@ -84,49 +218,88 @@ class Config:
     IRECIST_PMCID = "PMC5648544"
     EUTILS_BASE = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
     
-    # Journals for comprehensive fetching
+    # Journals for comprehensive fetching; each clause is combined with JOURNAL_FILTER
+    JOURNAL_FILTER = "hasabstract[text]"
+    MAX_GROUP_QUERY_CHARS = 2000  # Journals are OR-packed into searches up to this length...
+    MAX_GROUP_JOURNALS = 6        # ...and this many journals, so groups still run in parallel
+    
     RSNA_JOURNALS = [
-        '("Radiology"[Journal] OR 0033-8419[ISSN] OR 1527-1315[ISSN]) AND hasabstract[text]',
-        '("Radiographics"[Journal] OR 0271-5333[ISSN] OR 1527-1323[ISSN]) AND hasabstract[text]',
-        '("Radiology. Artificial intelligence"[Journal] OR 2638-6100[ISSN]) AND hasabstract[text]',
-        '("Radiology. Cardiothoracic imaging"[Journal] OR 2638-6135[ISSN]) AND hasabstract[text]',
-        '("Radiology. Imaging cancer"[Journal] OR 2638-616X[ISSN]) AND hasabstract[text]',
+        '("Radiology"[Journal] OR 0033-8419[ISSN] OR 1527-1315[ISSN])',
+        '("Radiographics"[Journal] OR 0271-5333[ISSN] OR 1527-1323[ISSN])',
+        '("Radiology. Artificial intelligence"[Journal] OR 2638-6100[ISSN])',
+        '("Radiology. Cardiothoracic imaging"[Journal] OR 2638-6135[ISSN])',
+        '("Radiology. Imaging cancer"[Journal] OR 2638-616X[ISSN])',
     ]
     
     TOP_RAD_JOURNALS = [
-        '"AJR. American journal of roentgenology"[Journal] AND hasabstract[text]',
-        '"European radiology"[Journal] AND hasabstract[text]',
-        '"European journal of radiology"[Journal] AND hasabstract[text]',
-        '"Investigative radiology"[Journal] AND hasabstract[text]',
-        '"Clinical radiology"[Journal] AND hasabstract[text]',
-        '"Skeletal radiology"[Journal] AND hasabstract[text]',
-        '"Pediatric radiology"[Journal] AND hasabstract[text]',
-        '"Neuroradiology"[Journal] AND hasabstract[text]',
-        '"Journal of computer assisted tomography"[Journal] AND hasabstract[text]',
-        '"Insights into imaging"[Journal] AND hasabstract[text]',
+        '"AJR. American journal of roentgenology"[Journal]',
+        '"European radiology"[Journal]',
+        '"European journal of radiology"[Journal]',
+        '"Investigative radiology"[Journal]',
+        '"Clinical radiology"[Journal]',
+        '"Skeletal radiology"[Journal]',
+        '"Pediatric radiology"[Journal]',
+        '"Neuroradiology"[Journal]',
+        '"Journal of computer assisted tomography"[Journal]',
+        '"Insights into imaging"[Journal]',
     ]
     
     ONCOLOGY_JOURNALS = [
-        '"The Lancet. Oncology"[Journal] AND hasabstract[text]',
-        '"Cancer cell"[Journal] AND hasabstract[text]',
-        '"Nature reviews. Clinical oncology"[Journal] AND hasabstract[text]',
-        '"Journal of the National Cancer Institute"[Journal] AND hasabstract[text]',
-        '"Cancer discovery"[Journal] AND hasabstract[text]',
-        '"Cancer research"[Journal] AND hasabstract[text]',
-        '"International journal of radiation oncology, biology, physics"[Journal] AND hasabstract[text]',
-        '"JAMA oncology"[Journal] AND hasabstract[text]',
-        '"The oncologist"[Journal] AND hasabstract[text]',
-        '"Gynecologic oncology"[Journal] AND hasabstract[text]',
-        '"Cancer"[Journal] AND hasabstract[text]',
-        '"British journal of cancer"[Journal] AND hasabstract[text]',
-        '"Cancers"[Journal] AND hasabstract[text]',
-        '"Neoplasia"[Journal] AND hasabstract[text]',
+        '"The Lancet. Oncology"[Journal]',
+        '"Cancer cell"[Journal]',
+        '"Nature reviews. Clinical oncology"[Journal]',
+        '"Journal of the National Cancer Institute"[Journal]',
+        '"Cancer discovery"[Journal]',
+        '"Cancer research"[Journal]',
+        '"International journal of radiation oncology, biology, physics"[Journal]',
+        '"JAMA oncology"[Journal]',
+        '"The oncologist"[Journal]',
+        '"Gynecologic oncology"[Journal]',
+        '"Cancer"[Journal]',
+        '"British journal of cancer"[Journal]',
+        '"Cancers"[Journal]',
+        '"Neoplasia"[Journal]',
     ]
     
+    @classmethod
+    def get_all_journal_clauses(cls):
+        """Get all journal clauses combined (a journal listed in several categories is searched once)"""
+        return list(dict.fromkeys(cls.RSNA_JOURNALS + cls.TOP_RAD_JOURNALS + cls.ONCOLOGY_JOURNALS))
+    
     @classmethod
     def get_all_journal_queries(cls):
-        """Get all journal queries combined"""
-        return cls.RSNA_JOURNALS + cls.TOP_RAD_JOURNALS + cls.ONCOLOGY_JOURNALS
+        """Get one full query per journal"""
+        return [cls.journal_query([clause]) for clause in cls.get_all_journal_clauses()]
+    
+    @classmethod
+    def journal_query(cls, clauses: List[str]) -> str:
+        """Build a search over one or more journal clauses"""
+        if len(clauses) == 1:
+            return f"{clauses[0]} AND {cls.JOURNAL_FILTER}"
+        return f"({' OR '.join(clauses)}) AND {cls.JOURNAL_FILTER}"
+    
+    @classmethod
+    def pack_journal_clauses(cls, clauses: List[str]) -> List[List[str]]:
+        """Group journal clauses into combined queries within the size limits"""
+        groups = []
+        for clause in clauses:
+            if (groups and len(groups[-1]) < cls.MAX_GROUP_JOURNALS
+                    and len(cls.journal_query(groups[-1] + [clause])) <= cls.MAX_GROUP_QUERY_CHARS):
+                groups[-1].append(clause)
+            else:
+                groups.append([clause])
+        return groups
+
+
+def estimate_tokens(text: str) -> float:
+    """Cheap subword token estimate for embedding models (no tokenizer dependency)"""
+    return len(text.split()) * Config.TOKENS_PER_WORD
+
+
+@functools.lru_cache(maxsize=None)
+def get_config() -> Config:
+    """Shared Config instance for all fetchers and processors"""
+    return Config()
 
 
 # ============================================================================
@@ -142,16 +315,253 @@ class HTTPSession:
         retry = Retry(
             total=8,
             backoff_factor=0.6,
-            status_forcelist=(429, 500, 502, 503, 504),
+            status_forcelist=(500, 502, 503, 504),  # 429 is handled by BaseFetcher's rate-limit hook
             allowed_methods=frozenset(["GET", "POST"]),
             raise_on_status=False
         )
-        s.mount("https://", HTTPAdapter(max_retries=retry))
-        s.mount("http://", HTTPAdapter(max_retries=retry))
-        s.headers.update({"User-Agent": "OncologyImagingDownload/2.0"})
+        # Pool sized for concurrent journal/eFetch/download threads hitting the same hosts
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        s.mount("https://", adapter)
+        s.mount("http://", adapter)
+        s.headers.update({
+            "User-Agent": "OncologyImagingDownload/2.0",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive"
+        })
         return s
 
 
+class RateLimiter:
+    """Thread-safe limiter spacing requests `interval` seconds apart, adapting to server feedback"""
+    
+    def __init__(self, interval: float, max_backoff: float = 8.0):
+        self.base_interval = interval
+        self.max_interval = interval * max_backoff
+        self.interval = interval
+        self._next_ts = 0.0
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Reserve the next request slot; returns seconds until it opens"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_ts)
+            self._next_ts = slot + self.interval
+        return slot - now
+    
+    def wait(self):
+        """Reserve the next request slot and sleep only until it opens"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    def observe(self, response):
+        """Widen spacing when the server signals pressure, relax it back toward the base rate otherwise"""
+        remaining = response.headers.get("X-RateLimit-Remaining", "")
+        with self._lock:
+            if response.status_code == 429:
+                self.interval = min(self.interval * 2, self.max_interval)
+                self._next_ts = max(self._next_ts, time.monotonic() + self.retry_after(response))
+            elif remaining.isdigit() and int(remaining) <= 1:
+                self.interval = min(self.interval * 2, self.max_interval)
+            else:
+                self.interval = max(self.base_interval, self.interval * 0.75)
+    
+    @staticmethod
+    def retry_after(response, default: float = 1.0) -> float:
+        """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+        value = response.headers.get("Retry-After", "").strip()
+        if not value:
+            return default
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return default
+
+
+class SearchCache:
+    """SQLite cache of eSearch PMID lists keyed by (query term, year); year 0 = all years"""
+    
+    def __init__(self, db_path: Path, max_age_days: int, closed_year_age_days: Optional[int] = None):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_age = max_age_days * 86400
+        self.closed_year_age = (closed_year_age_days or max_age_days) * 86400
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS esearch ("
+            " query_hash TEXT, year INTEGER, count INTEGER, pmids_json TEXT, fetched_at REAL,"
+            " PRIMARY KEY (query_hash, year))"
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def _hash(term: str) -> str:
+        return hashlib.sha1(term.encode("utf-8")).hexdigest()
+    
+    def get(self, term: str, year: int = 0) -> Optional[List[str]]:
+        """Return cached PMIDs, or None if missing or expired"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT pmids_json, fetched_at FROM esearch WHERE query_hash = ? AND year = ?",
+                (self._hash(term), year)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self._max_age(year):
+            return None
+        return _json_loads(row[0])
+    
+    def _max_age(self, year: int) -> float:
+        """Expiry for an entry; whole-range (year 0) and recent years use the short one"""
+        if year and year < datetime.now().year - 1:
+            return self.closed_year_age
+        return self.max_age
+    
+    def put(self, term: str, pmids: List[str], year: int = 0):
+        """Store PMIDs for a term"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO esearch VALUES (?, ?, ?, ?, ?)",
+                (self._hash(term), year, len(pmids), JSONFile.dumps(pmids, pretty=False), time.time())
+            )
+            self._conn.commit()
+
+
+class JSONFile:
+    """JSON output helpers (orjson when available, stdlib json otherwise)"""
+    
+    @staticmethod
+    def _default(obj):
+        """Serialize __slots__ record objects as objects keyed in slot order"""
+        slots = getattr(type(obj), '__slots__', None)
+        if slots is None:
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+        return {k: getattr(obj, k) for k in slots}
+    
+    @staticmethod
+    def dumps(obj, pretty=True) -> bytes:
+        """Serialize to UTF-8 JSON bytes; pretty matches json.dump(..., indent=2)"""
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+            return orjson.dumps(obj, default=JSONFile._default, option=option)
+        if pretty:
+            return json.dumps(obj, indent=2, ensure_ascii=False, default=JSONFile._default).encode('utf-8')
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=JSONFile._default).encode('utf-8')
+    
+    @staticmethod
+    def read(path: Path):
+        """Parse a JSON file, reusing the previous result while its mtime/size are unchanged (treat as read-only)"""
+        st = path.stat()
+        return JSONFile._read_cached(str(path), st.st_mtime_ns, st.st_size)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _read_cached(path: str, mtime_ns: int, size: int):
+        """Parse JSON bytes without a text decode step; keyed by path and stat so edits invalidate it"""
+        with open(path, 'rb') as f:
+            return _json_loads(f.read())
+    
+    @staticmethod
+    def write(path: Path, obj, pretty=True):
+        """Write an object as JSON (atomically, so a crash never leaves a truncated file)"""
+        data = JSONFile.dumps(obj, pretty)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+    
+    @staticmethod
+    def write_array(path: Path, items: Iterable, pretty=True) -> int:
+        """Stream items to a JSON array file one element at a time; returns the item count"""
+        with JSONArrayWriter(path, pretty) as writer:
+            for item in items:
+                writer.write(item)
+        return writer.count
+
+
+class JSONArrayWriter:
+    """Push-style JSON array file: append items one at a time (atomic, like JSONFile.write_array)"""
+    
+    def __init__(self, path: Path, pretty=True):
+        self.path = path
+        self.pretty = pretty
+        self.count = 0
+        self._open = None
+        self._file = None
+    
+    def __enter__(self):
+        self._open = _atomic_open(self.path, 'wb', buffering=1 << 20)
+        self._file = self._open.__enter__()
+        self._file.write(b'[')
+        return self
+    
+    def write(self, item):
+        """Append one element"""
+        data = JSONFile.dumps(item, self.pretty)
+        if self.pretty:
+            # Same layout json.dump(..., indent=2) gives a whole list
+            data = b"\n  " + data.replace(b"\n", b"\n  ")
+        self._file.write((b',' if self.count else b'') + data)
+        self.count += 1
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self._file.write(b'\n]' if self.pretty and self.count else b']')
+        return self._open.__exit__(exc_type, exc, tb)
+
+
+class Manifest:
+    """Completed-work record for an output directory: input path -> [mtime_ns, size, output names]"""
+    
+    FILENAME = ".manifest.json"
+    
+    def __init__(self, output_dir: Path):
+        self.output_dir = output_dir
+        self.path = output_dir / self.FILENAME
+        try:
+            self.entries = dict(JSONFile.read(self.path))
+        except (OSError, ValueError):
+            self.entries = {}
+    
+    @staticmethod
+    def _signature(input_path: Path) -> List[int]:
+        """[mtime_ns, size] of an input file"""
+        st = os.stat(input_path)
+        return [st.st_mtime_ns, st.st_size]
+    
+    def is_current(self, input_path: Path) -> bool:
+        """True if input_path is unchanged since its outputs were last completed and they all still exist"""
+        entry = self.entries.get(str(input_path))
+        if not entry or len(entry) < 3:
+            return False
+        try:
+            if entry[:2] != self._signature(input_path):
+                return False
+        except OSError:
+            return False
+        return all((self.output_dir / name).exists() for name in entry[2])
+    
+    def all_current(self, input_paths: List[Path]) -> bool:
+        """True if exactly these inputs are recorded and none has changed"""
+        return (len(input_paths) == len(self.entries)
+                and all(self.is_current(p) for p in input_paths))
+    
+    def record(self, input_path: Path, outputs: List[str]):
+        """Mark input_path as processed into outputs (call only after the outputs are fully written)"""
+        self.entries[str(input_path)] = self._signature(input_path) + [list(outputs)]
+    
+    def reset(self):
+        """Forget all recorded inputs"""
+        self.entries = {}
+    
+    def save(self):
+        """Write the manifest next to the outputs it describes"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        JSONFile.write(self.path, self.entries)
+
+
 class Logger:
     """Simple logging utility"""
     
@@ -185,21 +595,117 @@ class Logger:
 class BaseFetcher:
     """Base class for all data fetchers"""
     
+    # Shared by all fetchers and threads so the overall NCBI request rate stays capped
+    rate_limiter = RateLimiter(Config.BASE_DELAY)
+    
+    # One pooled session for all fetchers, so connections are reused across them
+    _session = None
+    _session_lock = threading.Lock()
+    
     def __init__(self):
-        self.session = HTTPSession.create()
-        self.config = Config()
+        self.session = self._shared_session()
+        self.config = get_config()
     
-    def throttle(self, delay=None):
-        """Rate limiting"""
-        time.sleep(delay or self.config.BASE_DELAY)
+    @classmethod
+    def _shared_session(cls) -> requests.Session:
+        """Create the shared session on first use"""
+        with BaseFetcher._session_lock:
+            if BaseFetcher._session is None:
+                session = HTTPSession.create()
+                session.hooks["response"].append(BaseFetcher._on_response)
+                BaseFetcher._session = session
+        return BaseFetcher._session
+    
+    def throttle(self):
+        """Rate limiting (waits for the next slot of the shared limiter)"""
+        self.rate_limiter.wait()
+    
+    @staticmethod
+    def _on_response(r, *args, **kwargs):
+        """Feed NCBI rate-limit headers to the limiter and retry 429s after Retry-After"""
+        is_ncbi = r.url.startswith(Config.EUTILS_BASE)
+        if is_ncbi:
+            BaseFetcher.rate_limiter.observe(r)
+        
+        attempts = getattr(r.request, "rate_limit_attempts", 0)
+        if r.status_code != 429 or attempts >= Config.RATE_LIMIT_RETRIES:
+            return r
+        
+        # observe() already pushed the shared limiter past Retry-After
+        if is_ncbi:
+            BaseFetcher.rate_limiter.wait()
+        else:
+            time.sleep(RateLimiter.retry_after(r))
+        
+        request = r.request.copy()
+        request.rate_limit_attempts = attempts + 1
+        r.close()
+        return BaseFetcher._session.send(request, **kwargs)
     
     def save_stream(self, response, output_path: Path):
         """Save streaming response to file"""
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "wb") as f:
+        with _atomic_open(output_path, "wb") as f:
             for chunk in response.iter_content(1 << 16):
                 if chunk:
                     f.write(chunk)
+        self._save_meta(response, output_path)
+    
+    def save_pdf(self, response, output_path: Path) -> bool:
+        """Save a PDF response, rejecting oversized bodies and HTML error pages"""
+        size = int(response.headers.get("Content-Length") or 0)
+        if size > self.config.MAX_PDF_BYTES:
+            response.close()
+            Logger.error(f"Refusing {output_path.name}: {size / (1 << 20):,.0f} MB exceeds size limit")
+            return False
+        
+        self.save_stream(response, output_path)
+        with open(output_path, "rb") as f:
+            head = f.read(1024)
+        if b"%PDF" not in head:
+            err_path = output_path.with_suffix(".html.err")
+            output_path.replace(err_path)
+            self._meta_path(output_path).unlink(missing_ok=True)
+            Logger.error(f"Not a PDF, kept response as {err_path.name}")
+            return False
+        return True
+    
+    def conditional_get(self, url: str, dest: Path, **kwargs):
+        """GET `url`, revalidating against the ETag/Last-Modified stored for `dest` (304 = unchanged)"""
+        headers = {}
+        if dest.exists():
+            meta = self._load_meta(dest)
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            # Without a recorded Last-Modified (older downloads, servers that only send one
+            # validator), the local copy's mtime is a safe lower bound: it was written after fetching
+            headers["If-Modified-Since"] = (meta.get("last_modified")
+                                            or formatdate(dest.stat().st_mtime, usegmt=True))
+        return self.session.get(url, headers=headers, **kwargs)
+    
+    @staticmethod
+    def _meta_path(dest: Path) -> Path:
+        return dest.with_name(dest.name + ".meta.json")
+    
+    @classmethod
+    def _load_meta(cls, dest: Path) -> Dict:
+        """Load cache validators recorded for a downloaded file"""
+        try:
+            with open(cls._meta_path(dest), "rb") as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+    
+    @classmethod
+    def _save_meta(cls, response, dest: Path):
+        """Record the response's cache validators next to the downloaded file"""
+        meta = {
+            "url": response.url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified")
+        }
+        if meta["etag"] or meta["last_modified"]:
+            JSONFile.write(cls._meta_path(dest), meta)
 
 
 # ============================================================================
@@ -209,23 +715,73 @@ class BaseFetcher:
 class JournalFetcher(BaseFetcher):
     """Fetches all abstracts from PubMed journals"""
     
+    # Column order of the per-journal CSVs (rows from _parse_article follow it)
+    CSV_FIELDS = ("pmid", "doi", "journal", "title", "abstract", "volume", "issue",
+                  "pub_year", "pub_month", "pub_day", "authors")
+    
+    # Precompiled XPath queries for _parse_article (relative to MedlineCitation/Article).
+    # string() yields a plain str ("" when absent) without a result list; smart_strings=False
+    # skips the per-result parent back-reference lxml would otherwise attach.
+    _XP_ARTICLE = etree.XPath("./MedlineCitation/Article")
+    _XP_PMID = etree.XPath("string(./MedlineCitation/PMID)", smart_strings=False)
+    _XP_TITLE = etree.XPath("string(./ArticleTitle)", smart_strings=False)
+    _XP_JOURNAL = etree.XPath("string(./Journal/Title)", smart_strings=False)
+    _XP_ABSTRACT = etree.XPath("./Abstract/AbstractText")
+    _XP_VOLUME = etree.XPath("string(./Journal/JournalIssue/Volume)", smart_strings=False)
+    _XP_ISSUE = etree.XPath("string(./Journal/JournalIssue/Issue)", smart_strings=False)
+    _XP_YEAR = etree.XPath("string(./Journal/JournalIssue/PubDate/Year)", smart_strings=False)
+    _XP_MONTH = etree.XPath("string(./Journal/JournalIssue/PubDate/Month)", smart_strings=False)
+    _XP_DAY = etree.XPath("string(./Journal/JournalIssue/PubDate/Day)", smart_strings=False)
+    _XP_DOI = etree.XPath("string(./ELocationID[@EIdType='doi'])", smart_strings=False)
+    _XP_AUTHORS = etree.XPath("./AuthorList/Author")
+    
+    # Journal titles and ISSNs of a PubmedArticle (relative to the article), for routing
+    _XP_JOURNAL_KEYS = etree.XPath(
+        "./MedlineCitation/Article/Journal/Title/text()"
+        " | ./MedlineCitation/Article/Journal/ISOAbbreviation/text()"
+        " | ./MedlineCitation/Article/Journal/ISSN/text()"
+        " | ./MedlineCitation/MedlineJournalInfo/MedlineTA/text()"
+        " | ./MedlineCitation/MedlineJournalInfo/ISSNLinking/text()",
+        smart_strings=False
+    )
+    
+    # Per-thread (event loop, httpx client) pairs for the async eFetch path
+    _async_local = threading.local()
+    _async_sessions: List[Tuple] = []
+    _async_sessions_lock = threading.Lock()
+    
     def __init__(self):
         super().__init__()
         self.output_dir = self.config.PUBMED_DIR
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.search_cache = SearchCache(self.output_dir / ".cache" / "esearch.sqlite",
+                                        self.config.SEARCH_CACHE_MAX_AGE_DAYS,
+                                        self.config.SEARCH_CACHE_CLOSED_YEAR_DAYS)
     
     def fetch_all_journals(self, skip_existing=True):
         """Fetch abstracts from all configured journals"""
         Logger.section("FETCHING JOURNAL ABSTRACTS FROM PUBMED")
         
-        queries = self.config.get_all_journal_queries()
-        Logger.info(f"Total journals to process: {len(queries)}")
+        clauses = self.config.get_all_journal_clauses()
+        Logger.info(f"Total journals to process: {len(clauses)}")
         
-        results = []
-        for query in queries:
-            result = self.fetch_journal(query, skip_existing)
-            if result:
-                results.append(result)
+        if skip_existing:
+            for clause in clauses:
+                if self._journal_path([clause]).exists():
+                    Logger.info(f"Skipping (exists): {self._journal_path([clause]).name}")
+            clauses = [c for c in clauses if not self._journal_path([c]).exists()]
+        
+        # One search per group of journals; results are split back into per-journal CSVs
+        groups = self.config.pack_journal_clauses(clauses)
+        Logger.info(f"Combined into {len(groups)} searches")
+        
+        # Groups are fetched concurrently; all threads share one session and rate limiter
+        try:
+            with ThreadPoolExecutor(max_workers=self.config.JOURNAL_WORKERS) as pool:
+                futures = [pool.submit(self.fetch_journal_group, group) for group in groups]
+                results = [r for f in futures for r in f.result()]
+        finally:
+            self.close_async_sessions()
         
         Logger.success(f"Completed fetching {len(results)} journals")
         return results
@@ -250,63 +806,144 @@ class JournalFetcher(BaseFetcher):
             
             Logger.info(f"  Found {len(pmids):,} articles")
             
-            # Fetch abstracts
-            articles = self._efetch_abstracts(pmids)
-            Logger.info(f"  Retrieved {len(articles):,} abstracts")
-            
-            # Save to CSV
-            self._save_csv(articles, output_path)
-            Logger.success(f"Saved: {filename} ({len(articles):,} abstracts)")
+            # Stream abstracts straight into the CSV as eFetch pages complete
+            count = self._save_csv(pmids, [output_path], lambda keys: 0)[0]
+            Logger.success(f"Saved: {filename} ({count:,} abstracts)")
             
-            return {"query": query, "count": len(articles), "file": filename}
+            return {"query": query, "count": count, "file": filename}
             
         except Exception as e:
             Logger.error(f"Failed to fetch {query[:60]}: {e}")
             return None
     
+    def fetch_journal_group(self, clauses: List[str]) -> List[Dict]:
+        """Fetch several journals with one combined search and split the results per journal"""
+        if len(clauses) == 1:
+            result = self.fetch_journal(self.config.journal_query(clauses), skip_existing=False)
+            return [result] if result else []
+        
+        query = self.config.journal_query(clauses)
+        Logger.info(f"Fetching {len(clauses)} journals: {query[:60]}...")
+        
+        try:
+            pmids = self._esearch_all(query)
+            if not pmids:
+                Logger.warning(f"No results for: {query[:60]}...")
+                return []
+            
+            Logger.info(f"  Found {len(pmids):,} articles")
+            
+            # Last output collects articles whose journal matches none of the clauses
+            unmatched = self.output_dir / f"unmatched_{hashlib.sha1(query.encode('utf-8')).hexdigest()[:10]}.csv"
+            paths = [self._journal_path([clause]) for clause in clauses] + [unmatched]
+            counts = self._save_csv(pmids, paths, self._journal_router(clauses))
+            
+            results = []
+            for clause, path, count in zip(clauses + [None], paths, counts):
+                if count == 0:
+                    path.unlink()
+                    if clause:
+                        Logger.warning(f"No results for: {path.name[:60]}...")
+                    continue
+                Logger.success(f"Saved: {path.name} ({count:,} abstracts)")
+                if clause:
+                    results.append({"query": self.config.journal_query([clause]),
+                                    "count": count, "file": path.name})
+            return results
+            
+        except Exception as e:
+            Logger.error(f"Failed to fetch {query[:60]}: {e}")
+            return []
+    
+    def _journal_path(self, clauses: List[str]) -> Path:
+        """CSV path for a journal query"""
+        return self.output_dir / (self._sanitize_filename(self.config.journal_query(clauses)) + ".csv")
+    
+    @staticmethod
+    def _journal_router(clauses: List[str]) -> Callable[[Tuple[str, ...]], int]:
+        """Map an article's journal keys to the index of its clause (len(clauses) if none match)"""
+        lookup = {}
+        for i, clause in enumerate(clauses):
+            for key in _JOURNAL_NAME_RE.findall(clause) + _JOURNAL_ISSN_RE.findall(clause):
+                lookup.setdefault(key.lower(), i)
+        
+        def route(keys: Tuple[str, ...]) -> int:
+            for key in keys:
+                if key in lookup:
+                    return lookup[key]
+            return len(clauses)
+        
+        return route
+    
     def _esearch_all(self, term: str) -> List[str]:
         """Search PubMed and return all PMIDs (handles large result sets)"""
-        # Get count
-        count = self._esearch_count(term)
+        cached = self.search_cache.get(term)
+        if cached is not None:
+            Logger.info(f"  Using cached PMID list ({len(cached):,})")
+            return cached
+        
+        # Get count (query is stored on the NCBI history server)
+        count, webenv, query_key = self._esearch_count(term)
         
         if count > 9000:
             # Split by year to handle 10k API limit
-            return self._esearch_by_year(term)
-        
-        # Fetch normally
-        pmids = []
-        for start in range(0, min(count, 9999), 500):
-            batch = self._esearch_page(term, start, 500)
-            pmids.extend(batch)
-            self.throttle()
+            pmids, complete = self._esearch_by_year(term, webenv, query_key)
+        else:
+            pmids = self._esearch_history(count, webenv, query_key)
+            complete = True
         
+        if complete:
+            self.search_cache.put(term, pmids)
         return pmids
     
-    def _esearch_count(self, term: str) -> int:
-        """Get count of search results"""
+    def _esearch_count(self, term: str, webenv: str = "") -> Tuple[int, str, str]:
+        """Get count of search results and the history server handle (WebEnv, query_key);
+        with `webenv`, `term` may reference earlier query keys in that session (#1, #2, ...)"""
+        return self._esearch_count_cached(term, webenv, self.config.NCBI_API_KEY)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _esearch_count_cached(term: str, webenv: str, api_key: Optional[str]) -> Tuple[int, str, str]:
+        """eSearch count memoized per process (failed calls are not cached)"""
         params = {
             "db": "pubmed",
             "term": term,
             "retmode": "json",
             "retmax": 0,
-            "tool": self.config.NCBI_TOOL,
-            "email": self.config.NCBI_EMAIL
+            "usehistory": "y",
+            "tool": Config.NCBI_TOOL,
+            "email": Config.NCBI_EMAIL
         }
-        if self.config.NCBI_API_KEY:
-            params["api_key"] = self.config.NCBI_API_KEY
+        if webenv:
+            params["WebEnv"] = webenv
+        if api_key:
+            params["api_key"] = api_key
         
-        self.throttle()
-        r = self.session.get(f"{self.config.EUTILS_BASE}/esearch.fcgi", params=params, timeout=120)
+        BaseFetcher.rate_limiter.wait()
+        r = BaseFetcher._shared_session().get(f"{Config.EUTILS_BASE}/esearch.fcgi", params=params, timeout=120)
         r.raise_for_status()
         
-        data = json.loads(self._clean_json(r.text))
-        return int(data["esearchresult"]["count"])
+        data = JournalFetcher._load_json(r)
+        result = data["esearchresult"]
+        return int(result["count"]), result.get("webenv", ""), result.get("querykey", "")
+    
+    def _esearch_history(self, count: int, webenv: str, query_key: str) -> List[str]:
+        """Page through a result set stored on the history server (eSearch caps at 9,999)"""
+        starts = range(0, min(count, 9999), 500)
+        if len(starts) <= 1:
+            return [pmid for start in starts for pmid in self._esearch_page(webenv, query_key, start, 500)]
+        
+        # Pages are independent; overlap their round trips (the shared limiter still sets the pace)
+        with ThreadPoolExecutor(max_workers=min(self.config.EFETCH_WORKERS, len(starts))) as pool:
+            pages = pool.map(lambda start: self._esearch_page(webenv, query_key, start, 500), starts)
+            return [pmid for page in pages for pmid in page]
     
-    def _esearch_page(self, term: str, retstart: int, retmax: int) -> List[str]:
-        """Get a page of PMIDs"""
+    def _esearch_page(self, webenv: str, query_key: str, retstart: int, retmax: int) -> List[str]:
+        """Get a page of PMIDs from a result set stored on the history server"""
         params = {
             "db": "pubmed",
-            "term": term,
+            "term": f"#{query_key}",
+            "WebEnv": webenv,
             "retmode": "json",
             "retstart": retstart,
             "retmax": retmax,
@@ -320,147 +957,393 @@ class JournalFetcher(BaseFetcher):
         r = self.session.get(f"{self.config.EUTILS_BASE}/esearch.fcgi", params=params, timeout=120)
         r.raise_for_status()
         
-        data = json.loads(self._clean_json(r.text))
+        data = self._load_json(r)
         return data["esearchresult"].get("idlist", [])
     
-    def _esearch_by_year(self, term: str) -> List[str]:
-        """Fetch PMIDs by splitting into year ranges"""
+    def _esearch_by_year(self, term: str, webenv: str = "", query_key: str = "") -> Tuple[List[str], bool]:
+        """Fetch PMIDs by splitting into year ranges; also reports whether every year succeeded.
+        Given the history handle of the full search, years are narrowed from it server-side"""
         Logger.info("  Large dataset - splitting by year...")
-        all_pmids = []
-        
-        for year in range(1950, datetime.now().year + 1):
-            year_term = f'{term} AND {year}[pdat]'
-            try:
-                count = self._esearch_count(year_term)
-                if count == 0:
-                    continue
-                
+        years = range(1950, datetime.now().year + 1)
+        
+        # Years are independent searches; run them concurrently under the shared rate limiter
+        with ThreadPoolExecutor(max_workers=self.config.EFETCH_WORKERS) as pool:
+            results = list(pool.map(lambda year: self._esearch_year(term, year, webenv, query_key), years))
+        
+        # Ordered dedup in one C-level pass per year (year buckets rarely overlap)
+        all_pmids = {}
+        complete = True
+        for year, pmids in zip(years, results):
+            if pmids is None:
+                complete = False
+                continue
+            if pmids:
+                all_pmids.update(dict.fromkeys(pmids))
+                Logger.info(f"    {year}: {len(pmids):,} articles")
+        
+        return list(all_pmids), complete
+    
+    def _esearch_year(self, term: str, year: int, webenv: str = "", query_key: str = "") -> Optional[List[str]]:
+        """PMIDs for one publication year (cached), or None if the search failed"""
+        pmids = self.search_cache.get(term, year)
+        if pmids is not None:
+            return pmids
+        
+        # Refer to the stored full search (#key) so NCBI does not re-parse the journal OR clause
+        base = f'#{query_key}' if webenv and query_key else term
+        year_term = f'{base} AND {year}[pdat]'
+        try:
+            count, year_webenv, year_key = self._esearch_count(year_term, webenv)
+            if count > 9999:
+                # Combined journal searches can exceed the cap within a year
                 pmids = []
-                for start in range(0, min(count, 9999), 500):
-                    batch = self._esearch_page(year_term, start, 500)
-                    pmids.extend(batch)
-                    self.throttle()
-                
-                if pmids:
-                    all_pmids.extend(pmids)
-                    Logger.info(f"    {year}: {len(pmids):,} articles")
-            except Exception as e:
-                Logger.warning(f"    {year}: error - {e}")
+                for month in range(1, 13):
+                    month_term = f'{base} AND {year}/{month:02d}[pdat]'
+                    pmids.extend(self._esearch_history(*self._esearch_count(month_term, webenv)))
+            else:
+                pmids = self._esearch_history(count, year_webenv, year_key)
+        except Exception as e:
+            Logger.warning(f"    {year}: error - {e}")
+            return None
         
-        return list(dict.fromkeys(all_pmids))  # Deduplicate
+        self.search_cache.put(term, pmids, year)
+        return pmids
     
-    def _efetch_abstracts(self, pmids: List[str], batch_size=200) -> List[Dict]:
-        """Fetch article metadata and abstracts"""
-        articles = []
+    def _epost(self, pmids: List[str], chunk_size=10000) -> List[Tuple[str, str, int]]:
+        """Upload PMIDs to the history server; returns (WebEnv, query_key, count) per upload"""
+        history_sets = []
+        webenv = None
         
-        for i in range(0, len(pmids), batch_size):
-            batch = pmids[i:i + batch_size]
+        for i in range(0, len(pmids), chunk_size):
+            chunk = pmids[i:i + chunk_size]
             
-            params = {
+            data = {
                 "db": "pubmed",
-                "id": ",".join(batch),
-                "retmode": "xml",
+                "id": ",".join(chunk),
                 "tool": self.config.NCBI_TOOL,
                 "email": self.config.NCBI_EMAIL
             }
+            if webenv:
+                # Append to the same history session
+                data["WebEnv"] = webenv
             if self.config.NCBI_API_KEY:
-                params["api_key"] = self.config.NCBI_API_KEY
+                data["api_key"] = self.config.NCBI_API_KEY
             
             self.throttle()
-            r = self.session.get(f"{self.config.EUTILS_BASE}/efetch.fcgi", params=params, timeout=120)
+            r = self.session.post(f"{self.config.EUTILS_BASE}/epost.fcgi", data=data, timeout=120)
             r.raise_for_status()
             
-            root = ET.fromstring(r.text)
-            for article in root.findall("PubmedArticle"):
-                parsed = self._parse_article(article)
-                if parsed:
-                    articles.append(parsed)
+            root = etree.fromstring(r.content)
+            webenv = root.findtext("WebEnv", "").strip()
+            query_key = root.findtext("QueryKey", "").strip()
+            if not webenv or not query_key:
+                raise RuntimeError(f"EPost returned no history handle: {r.text[:200]}")
+            history_sets.append((webenv, query_key, len(chunk)))
+        
+        return history_sets
+    
+    def _iter_pages(self, pmids: List[str]) -> Iterator[List[ParsedArticle]]:
+        """Yield parsed article rows one eFetch page at a time, in PMID order"""
+        batch_size = self.config.EFETCH_BATCH_SIZE
+        # Upload once, then page eFetch through the stored sets; one set per checkpoint
+        # keeps checkpoints aligned with set boundaries whatever order NCBI returns a set in
+        pages = (
+            (webenv, query_key, start, batch_size)
+            for webenv, query_key, count in self._epost(pmids, batch_size * self.config.CHECKPOINT_EVERY)
+            for start in range(0, count, batch_size)
+        )
+        
+        if HTTPX_AVAILABLE:
+            yield from self._iter_pages_async(pages)
+            return
+        
+        # Workers download and parse pages as bytes arrive; this thread only writes rows.
+        # The bounded window keeps memory flat on huge journals.
+        window = self.config.EFETCH_WORKERS * 2
+        with ThreadPoolExecutor(max_workers=self.config.EFETCH_WORKERS) as pool:
+            pending = deque()
+            for page in pages:
+                pending.append(pool.submit(self._efetch_page, *page))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    
+    def _iter_pages_async(self, pages: Iterator[Tuple[str, str, int, int]]) -> Iterator[List[ParsedArticle]]:
+        """Same as the threaded path, but multiplexes page windows over one httpx client"""
+        window = self.config.EFETCH_WORKERS * 2
+        loop, client = self._async_session()
+        batch = []
+        for page in pages:
+            batch.append(page)
+            if len(batch) >= window:
+                yield from loop.run_until_complete(self._async_efetch_pages(client, batch))
+                batch = []
+        if batch:
+            yield from loop.run_until_complete(self._async_efetch_pages(client, batch))
+    
+    def _async_session(self) -> Tuple[asyncio.AbstractEventLoop, "httpx.AsyncClient"]:
+        """Event loop and httpx client for the calling thread, kept open across journals so the
+        HTTP/2 connection (and its TLS session) is reused; see close_async_sessions"""
+        session = getattr(self._async_local, "session", None)
+        if session is None:
+            loop = asyncio.new_event_loop()
+            client = httpx.AsyncClient(
+                timeout=120,
+                # Connection is a hop-by-hop header that HTTP/2 forbids
+                headers={k: v for k, v in self.session.headers.items() if k.lower() != "connection"},
+                # Transport-level retries cover connect failures; HTTP errors are retried in _async_efetch_page
+                transport=httpx.AsyncHTTPTransport(
+                    http2=HTTP2_AVAILABLE,
+                    retries=3,
+                    limits=httpx.Limits(max_connections=self.config.EFETCH_WORKERS,
+                                        max_keepalive_connections=self.config.EFETCH_WORKERS)
+                )
+            )
+            session = self._async_local.session = (loop, client)
+            with JournalFetcher._async_sessions_lock:
+                JournalFetcher._async_sessions.append(session)
+        return session
+    
+    @classmethod
+    def close_async_sessions(cls):
+        """Close every thread's httpx client and event loop"""
+        with cls._async_sessions_lock:
+            sessions, cls._async_sessions = cls._async_sessions, []
+            cls._async_local = threading.local()
+        for loop, client in sessions:
+            loop.run_until_complete(client.aclose())
+            loop.close()
+    
+    async def _async_efetch_pages(self, client, pages: List[Tuple[str, str, int, int]]) -> List[List[ParsedArticle]]:
+        """Fetch a window of pages concurrently; results keep page order"""
+        return await asyncio.gather(*(self._async_efetch_page(client, *page) for page in pages))
+    
+    async def _async_efetch_page(self, client, webenv: str, query_key: str,
+                                 retstart: int, retmax: int) -> List[ParsedArticle]:
+        """Fetch and stream-parse a single page of a history set over httpx"""
+        params = self._efetch_params(webenv, query_key, retstart, retmax)
+        url = f"{self.config.EUTILS_BASE}/efetch.fcgi"
+        
+        for attempt in range(self.config.RATE_LIMIT_RETRIES + 1):
+            delay = self.rate_limiter.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                async with client.stream("GET", url, params=params) as r:
+                    self.rate_limiter.observe(r)
+                    if r.status_code == 429:
+                        continue  # observe() already deferred the next slot past Retry-After
+                    if r.status_code < 500:
+                        r.raise_for_status()
+                        
+                        # Feed chunks to a pull parser as they arrive
+                        parser = self._pull_parser()
+                        articles = []
+                        async for chunk in r.aiter_bytes():
+                            parser.feed(chunk)
+                            articles.extend(self._collect_articles(parser.read_events()))
+                        parser.close()
+                        articles.extend(self._collect_articles(parser.read_events()))
+                        return articles
+            except httpx.TransportError:
+                pass
+            # Server error or dropped connection: back off like the urllib3 Retry does
+            await asyncio.sleep(0.6 * (2 ** attempt))
+        
+        raise RuntimeError(f"eFetch failed after {self.config.RATE_LIMIT_RETRIES + 1} attempts (retstart={retstart})")
+    
+    def _efetch_params(self, webenv: str, query_key: str, retstart: int, retmax: int) -> Dict:
+        """eFetch parameters for one page of a history set"""
+        params = {
+            "db": "pubmed",
+            "WebEnv": webenv,
+            "query_key": query_key,
+            "retstart": retstart,
+            "retmax": retmax,
+            "retmode": "xml",
+            "tool": self.config.NCBI_TOOL,
+            "email": self.config.NCBI_EMAIL
+        }
+        if self.config.NCBI_API_KEY:
+            params["api_key"] = self.config.NCBI_API_KEY
+        return params
+    
+    def _efetch_page(self, webenv: str, query_key: str, retstart: int, retmax: int) -> List[ParsedArticle]:
+        """Download a single page of a history set, parsing the XML stream without buffering the body"""
+        params = self._efetch_params(webenv, query_key, retstart, retmax)
         
+        self.throttle()
+        with self.session.get(f"{self.config.EUTILS_BASE}/efetch.fcgi", params=params,
+                              stream=True, timeout=120) as r:
+            r.raise_for_status()
+            parser = self._pull_parser()
+            articles = []
+            for chunk in r.iter_content(1 << 16):
+                parser.feed(chunk)
+                articles.extend(self._collect_articles(parser.read_events()))
+        parser.close()
+        articles.extend(self._collect_articles(parser.read_events()))
         return articles
     
-    def _parse_article(self, article: ET.Element) -> Optional[Dict]:
-        """Parse article XML into dictionary"""
+    @staticmethod
+    def _pull_parser() -> etree.XMLPullParser:
+        """Incremental parser emitting each completed PubmedArticle"""
+        return etree.XMLPullParser(events=("end",), tag="PubmedArticle", huge_tree=True)
+    
+    def _collect_articles(self, events) -> List[ParsedArticle]:
+        """Parse PubmedArticle end events into (journal keys, row) pairs, freeing each subtree once parsed"""
+        articles = []
+        for _, article in events:
+            parsed = self._parse_article(article)
+            if parsed:
+                keys = tuple(key.strip().lower() for key in self._XP_JOURNAL_KEYS(article))
+                articles.append((keys, parsed))
+            article.clear()
+            while article.getprevious() is not None:
+                del article.getparent()[0]
+        return articles
+    
+    def _parse_article(self, article: etree._Element) -> Optional[Tuple[str, ...]]:
+        """Parse article XML into a CSV row"""
         try:
-            med = article.find("./MedlineCitation/Article")
-            if med is None:
+            med = self._XP_ARTICLE(article)
+            if not med:
                 return None
+            med = med[0]
             
-            pmid = article.findtext("./MedlineCitation/PMID", "").strip()
-            title = med.findtext("ArticleTitle", "").strip()
-            journal = med.findtext("./Journal/Title", "").strip()
+            pmid = self._XP_PMID(article).strip()
+            title = self._XP_TITLE(med).strip()
+            journal = self._XP_JOURNAL(med).strip()
             
             # Get abstract
             abstract_parts = []
-            abs_node = med.find("Abstract")
-            if abs_node is not None:
-                for text_node in abs_node.findall("AbstractText"):
-                    label = text_node.attrib.get("Label")
-                    text = (text_node.text or "").strip()
-                    if text:
-                        abstract_parts.append(f"{label}: {text}" if label else text)
+            for text_node in self._XP_ABSTRACT(med):
+                label = text_node.get("Label")
+                text = (text_node.text or "").strip()
+                if text:
+                    abstract_parts.append(f"{label}: {text}" if label else text)
             
             abstract = "\n".join(abstract_parts)
             if not abstract:
                 return None
             
             # Publication info
-            volume = med.findtext("./Journal/JournalIssue/Volume", "").strip()
-            issue = med.findtext("./Journal/JournalIssue/Issue", "").strip()
-            year = med.findtext("./Journal/JournalIssue/PubDate/Year", "").strip()
-            month = med.findtext("./Journal/JournalIssue/PubDate/Month", "").strip()
-            day = med.findtext("./Journal/JournalIssue/PubDate/Day", "").strip()
+            volume = self._XP_VOLUME(med).strip()
+            issue = self._XP_ISSUE(med).strip()
+            year = self._XP_YEAR(med).strip()
+            month = self._XP_MONTH(med).strip()
+            day = self._XP_DAY(med).strip()
             
             # DOI
-            doi = ""
-            for eid in med.findall("ELocationID"):
-                if eid.attrib.get("EIdType", "").lower() == "doi":
-                    doi = (eid.text or "").strip()
-                    break
+            doi = self._XP_DOI(med).strip()
             
             # Authors
             authors = []
-            for author in med.findall("./AuthorList/Author"):
-                first = author.findtext("ForeName", "").strip()
-                last = author.findtext("LastName", "").strip()
-                if first or last:
-                    authors.append(f"{first} {last}".strip())
+            for author in self._XP_AUTHORS(med):
+                # One walk over the author's children instead of an XPath query per name part
+                fore = last = ""
+                for part in author:
+                    if part.tag == "ForeName":
+                        fore = (part.text or "").strip()
+                    elif part.tag == "LastName":
+                        last = (part.text or "").strip()
+                if fore or last:
+                    authors.append(f"{fore} {last}".strip())
             
-            return {
-                "pmid": pmid,
-                "doi": doi,
-                "journal": journal,
-                "title": title,
-                "abstract": abstract,
-                "volume": volume,
-                "issue": issue,
-                "pub_year": year,
-                "pub_month": month,
-                "pub_day": day,
-                "authors": "; ".join(authors)
-            }
+            # Row in CSV_FIELDS order
+            return (pmid, doi, journal, title, abstract, volume, issue,
+                    year, month, day, "; ".join(authors))
             
         except Exception:
             return None
     
-    def _save_csv(self, articles: List[Dict], output_path: Path):
-        """Save articles to CSV"""
-        fields = ["pmid", "doi", "journal", "title", "abstract", "volume", "issue",
-                  "pub_year", "pub_month", "pub_day", "authors"]
-        
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fields)
-            writer.writeheader()
-            writer.writerows(articles)
+    def _save_csv(self, pmids: List[str], output_paths: List[Path],
+                  route: Callable[[Tuple[str, ...]], int]) -> List[int]:
+        """Fetch PMIDs and stream each row to the CSV chosen by `route` via resumable .part files;
+        returns the row count per output"""
+        part_paths = [p.with_name(p.name + ".part") for p in output_paths]
+        progress_path = output_paths[0].with_name(output_paths[0].name + ".progress.json")
+        # Page size is part of the digest: a checkpoint counts pages, so it only resumes at the same size
+        digest = hashlib.sha1(f"{self.config.EFETCH_BATCH_SIZE}\n".encode("ascii"))
+        digest.update("\n".join(pmids).encode("ascii"))
+        digest = digest.hexdigest()
+        
+        # Resume from the last checkpoint if it belongs to the same PMID list
+        progress = None
+        if all(p.exists() for p in part_paths):
+            progress = self._load_progress(progress_path, digest)
+        if progress:
+            for part_path, offset in zip(part_paths, progress["offsets"]):
+                os.truncate(part_path, offset)
+            pages_done, counts = progress["pages"], progress["rows"]
+            Logger.info(f"  Resuming after {sum(counts):,} abstracts")
+        else:
+            pages_done, counts = 0, [0] * len(output_paths)
+        
+        remaining = pmids[pages_done * self.config.EFETCH_BATCH_SIZE:]
+        with ExitStack() as stack:
+            files = [stack.enter_context(open(p, "a" if progress else "w", newline="", encoding="utf-8",
+                                              buffering=1 << 20))
+                     for p in part_paths]
+            writers = [csv.writer(f) for f in files]
+            if not progress:
+                for writer in writers:
+                    writer.writerow(self.CSV_FIELDS)
+            
+            for rows in self._iter_pages(remaining):
+                for keys, row in rows:
+                    i = route(keys)
+                    writers[i].writerow(row)
+                    counts[i] += 1
+                pages_done += 1
+                if pages_done % self.config.CHECKPOINT_EVERY == 0:
+                    offsets = []
+                    for f in files:
+                        f.flush()
+                        offsets.append(f.tell())
+                    self._save_progress(progress_path, {"digest": digest, "pages": pages_done,
+                                                        "rows": counts, "offsets": offsets})
+        
+        for part_path, output_path in zip(part_paths, output_paths):
+            part_path.replace(output_path)
+        if progress_path.exists():
+            progress_path.unlink()
+        return counts
+    
+    @staticmethod
+    def _load_progress(progress_path: Path, digest: str) -> Optional[Dict]:
+        """Load an eFetch checkpoint matching the given PMID list digest"""
+        try:
+            with open(progress_path, "rb") as f:
+                progress = _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        return progress if progress.get("digest") == digest and "offsets" in progress else None
+    
+    @staticmethod
+    def _save_progress(progress_path: Path, progress: Dict):
+        """Atomically write an eFetch checkpoint"""
+        JSONFile.write(progress_path, progress, pretty=False)
     
     @staticmethod
     def _sanitize_filename(text: str) -> str:
         """Create safe filename from text"""
-        return re.sub(r'[^A-Za-z0-9_.-]+', "_", text)[:100].strip("_")
+        return _SANITIZE_RE.sub("_", text)[:100].strip("_")
+    
+    @classmethod
+    def _load_json(cls, r) -> Dict:
+        """Decode a JSON response, stripping control characters only if it fails to parse"""
+        try:
+            # Parse the raw bytes directly; skips decoding r.text on the happy path
+            return _json_loads(r.content)
+        except ValueError:
+            return json.loads(cls._clean_json(r.text))
     
     @staticmethod
     def _clean_json(text: str) -> str:
         """Remove control characters from JSON"""
-        return re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', text)
+        return _CTRL_RE.sub('', text)
 
 
 # ============================================================================
@@ -470,6 +1353,19 @@ class JournalFetcher(BaseFetcher):
 class TerminologyFetcher(BaseFetcher):
     """Fetches RadLex, LOINC, and clinical guidelines"""
     
+    # Per-host download slots, shared across instances and threads
+    _host_slots: Dict[str, threading.Semaphore] = {}
+    _host_slots_lock = threading.Lock()
+    
+    def fetch_all(self, skip_existing=True) -> Dict:
+        """Download RadLex and the RECIST/iRECIST guidelines concurrently over the shared keep-alive pool
+        (LOINC requires manual download)"""
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            radlex = pool.submit(self.fetch_radlex, skip_existing)
+            recist = pool.submit(self.fetch_recist, skip_existing)
+            irecist = pool.submit(self.fetch_irecist, skip_existing)
+            return {'radlex': radlex.result(), 'recist': recist.result(), 'irecist': irecist.result()}
+    
     def fetch_radlex(self, skip_existing=True):
         """Download RadLex ontology files"""
         Logger.section("FETCHING RADLEX TERMINOLOGY")
@@ -484,34 +1380,48 @@ class TerminologyFetcher(BaseFetcher):
             r = self.session.get(self.config.RADLEX_URL, timeout=60)
             r.raise_for_status()
             
-            links = re.findall(r'href="(https?://[^"]+\.(?:owl|xlsx|json|zip))"', r.text, re.I)
-            links = list(dict.fromkeys(links))
+            links = list(dict.fromkeys(link.decode("utf-8", "replace")
+                                       for link in _RADLEX_HREF_RE.findall(r.content)))
             
-            saved = []
-            for url in links:
-                try:
-                    filename = url.split("/")[-1]
-                    dest = self.config.RADLEX_DIR / filename
-                    
-                    if skip_existing and dest.exists():
-                        Logger.info(f"Skipping (exists): {filename}")
-                        saved.append(dest)
-                        continue
-                    
-                    resp = self.session.get(url, stream=True, timeout=180)
-                    if resp.status_code == 200:
-                        self.save_stream(resp, dest)
-                        saved.append(dest)
-                        Logger.success(f"Downloaded: {filename}")
-                except Exception as e:
-                    Logger.warning(f"Failed to download {filename}: {e}")
+            with ThreadPoolExecutor(max_workers=self.config.DOWNLOAD_WORKERS) as pool:
+                results = list(pool.map(lambda url: self._download_one(url, skip_existing), links))
             
-            return saved
+            return [dest for dest in results if dest]
             
         except Exception as e:
             Logger.error(f"Failed to fetch RadLex: {e}")
             return []
     
+    def _download_one(self, url: str, skip_existing=True) -> Optional[Path]:
+        """Download a single RadLex file, limiting concurrent downloads per host"""
+        filename = url.split("/")[-1]
+        dest = self.config.RADLEX_DIR / filename
+        
+        if skip_existing and dest.exists():
+            Logger.info(f"Skipping (exists): {filename}")
+            return dest
+        
+        try:
+            with self._host_slot(urlparse(url).netloc):
+                resp = self.conditional_get(url, dest, stream=True, timeout=180)
+                if resp.status_code == 304:
+                    Logger.info(f"Unchanged: {filename}")
+                    return dest
+                if resp.status_code == 200:
+                    self.save_stream(resp, dest)
+                    Logger.success(f"Downloaded: {filename}")
+                    return dest
+        except Exception as e:
+            Logger.warning(f"Failed to download {filename}: {e}")
+        return None
+    
+    def _host_slot(self, host: str) -> threading.Semaphore:
+        """Semaphore capping concurrent downloads from one host"""
+        with self._host_slots_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.Semaphore(self.config.DOWNLOADS_PER_HOST)
+            return self._host_slots[host]
+    
     def fetch_loinc(self, skip_existing=True):
         """Extract LOINC from manually downloaded zip"""
         Logger.section("EXTRACTING LOINC RADIOLOGY PLAYBOOK")
@@ -526,7 +1436,7 @@ class TerminologyFetcher(BaseFetcher):
             return [playbook_csv]
         
         # Look for LOINC zip
-        zips = list(loinc_dir.glob("Loinc_*.zip")) + list(loinc_dir.glob("LOINC_*.zip"))
+        zips = [z for z in _list_files(loinc_dir, ".zip") if z.name.startswith(("Loinc_", "LOINC_"))]
         
         if not zips:
             Logger.warning("No LOINC zip found. Manual download required.")
@@ -539,20 +1449,23 @@ class TerminologyFetcher(BaseFetcher):
             
             saved = []
             with zipfile.ZipFile(zip_path, 'r') as zf:
-                # Extract Radiology Playbook
-                playbook_files = [f for f in zf.namelist()
-                                  if 'RadiologyPlaybook' in f and f.endswith('.csv')]
-                
-                for pf in playbook_files:
-                    extract_path = loinc_dir / Path(pf).name
+                # Extract Radiology Playbook (single pass over the central directory)
+                for info in zf.infolist():
+                    if 'RadiologyPlaybook' not in info.filename or not info.filename.endswith('.csv'):
+                        continue
+                    extract_path = loinc_dir / Path(info.filename).name
                     
                     if skip_existing and extract_path.exists():
                         Logger.info(f"Skipping (exists): {extract_path.name}")
                         saved.append(extract_path)
                         continue
                     
-                    with zf.open(pf) as source, open(extract_path, 'wb') as target:
-                        target.write(source.read())
+                    # Streamed copy straight into place; the member's CRC is checked as it is read,
+                    # and a truncated or oversized copy never replaces the destination
+                    with zf.open(info) as source, _atomic_open(extract_path, 'wb') as target:
+                        shutil.copyfileobj(source, target, length=1 << 20)
+                        if target.tell() != info.file_size:
+                            raise IOError(f"Size mismatch extracting {info.filename}")
                     saved.append(extract_path)
                     Logger.success(f"Extracted: {extract_path.name}")
             
@@ -574,11 +1487,15 @@ class TerminologyFetcher(BaseFetcher):
             return dest
         
         try:
-            r = self.session.get(self.config.RECIST_PDF, stream=True, timeout=180)
-            if r.status_code == 200:
-                self.save_stream(r, dest)
-                Logger.success(f"Downloaded: {dest.name}")
+            r = self.conditional_get(self.config.RECIST_PDF, dest, stream=True, timeout=180)
+            if r.status_code == 304:
+                Logger.info(f"Unchanged: {dest.name}")
                 return dest
+            if r.status_code == 200:
+                if self.save_pdf(r, dest):
+                    Logger.success(f"Downloaded: {dest.name}")
+                    return dest
+                return None
             else:
                 Logger.error(f"Failed to download (status {r.status_code})")
                 return None
@@ -601,9 +1518,11 @@ class TerminologyFetcher(BaseFetcher):
         pdf_url = f"https://pmc.ncbi.nlm.nih.gov/articles/{self.config.IRECIST_PMCID}/pdf/"
         
         try:
-            r = self.session.get(pdf_url, stream=True, timeout=180)
-            if r.status_code == 200:
-                self.save_stream(r, dest)
+            r = self.conditional_get(pdf_url, dest, stream=True, timeout=180)
+            if r.status_code == 304:
+                Logger.info(f"Unchanged: {dest.name}")
+                return dest
+            if r.status_code == 200 and self.save_pdf(r, dest):
                 Logger.success(f"Downloaded: {dest.name}")
                 return dest
         except Exception as e:
@@ -640,11 +1559,106 @@ class TerminologyFetcher(BaseFetcher):
 # Abstract Processor
 # ============================================================================
 
+class RagMeta:
+    """Abstract document metadata; serialized by JSONFile in __slots__ order"""
+    
+    __slots__ = ('pmid', 'doi', 'journal', 'year', 'month', 'authors', 'source', 'document_type')
+    
+    def __init__(self, pmid, doi, journal, year, month, authors, source='pubmed', document_type='abstract'):
+        self.pmid = pmid
+        self.doi = doi
+        self.journal = journal
+        self.year = year
+        self.month = month
+        self.authors = authors
+        self.source = source
+        self.document_type = document_type
+
+
+class RagDoc:
+    """RAG document for one abstract"""
+    
+    __slots__ = ('id', 'title', 'text', 'metadata')
+    
+    def __init__(self, id: str, title: str, text: str, metadata: RagMeta):
+        self.id = id
+        self.title = title
+        self.text = text
+        self.metadata = metadata
+
+
+class RagChunk:
+    """Embedding chunk of one abstract"""
+    
+    __slots__ = ('chunk_id', 'pmid', 'text', 'chunk_index', 'total_chunks')
+    
+    def __init__(self, chunk_id: str, pmid: str, text: str, chunk_index: int, total_chunks: int):
+        self.chunk_id = chunk_id
+        self.pmid = pmid
+        self.text = text
+        self.chunk_index = chunk_index
+        self.total_chunks = total_chunks
+
+
+class AbstractStats:
+    """Abstract statistics: per-abstract counts in bulk, chunk lengths accumulated while chunks stream"""
+    
+    __slots__ = ('documents', 'journal_counts', 'year_counts',
+                 'abstract_len_min', 'abstract_len_max', 'abstract_len_sum', 'abstract_len_n',
+                 'chunk_len_min', 'chunk_len_max', 'chunk_len_sum', 'chunk_len_n')
+    
+    def __init__(self):
+        self.documents = 0
+        self.journal_counts = Counter()
+        self.year_counts = Counter()
+        self.abstract_len_min = self.abstract_len_max = self.abstract_len_sum = self.abstract_len_n = 0
+        self.chunk_len_min = self.chunk_len_max = self.chunk_len_sum = self.chunk_len_n = 0
+    
+    def add_abstracts(self, abstracts: List[Dict]):
+        """Count journals and years with Counter, and abstract lengths with running min/max/sum"""
+        if not abstracts:
+            return
+        self.documents += len(abstracts)
+        self.journal_counts.update(map(operator.itemgetter('journal'), abstracts))
+        self.year_counts.update(filter(None, map(operator.itemgetter('pub_year'), abstracts)))
+        
+        # Each length is computed once and folded in; no list of lengths is built
+        low = self.abstract_len_min if self.abstract_len_n else sys.maxsize
+        high = self.abstract_len_max
+        total = 0
+        for length in map(len, map(operator.itemgetter('abstract'), abstracts)):
+            if length < low:
+                low = length
+            if length > high:
+                high = length
+            total += length
+        self.abstract_len_min = low
+        self.abstract_len_max = high
+        self.abstract_len_sum += total
+        self.abstract_len_n += len(abstracts)
+    
+    def add_chunk(self, length: int):
+        """Count one chunk's text length"""
+        self.chunk_len_min = min(self.chunk_len_min, length) if self.chunk_len_n else length
+        self.chunk_len_max = max(self.chunk_len_max, length)
+        self.chunk_len_sum += length
+        self.chunk_len_n += 1
+
+
 class AbstractProcessor:
     """Processes PubMed abstracts into RAG format"""
     
+    # Row accessors; _read_csv guarantees every CSV_FIELDS key is present
+    _DOC_FIELDS = operator.itemgetter('pmid', 'doi', 'title', 'journal', 'pub_year', 'pub_month', 'authors', 'abstract')
+    _CHUNK_FIELDS = operator.itemgetter('pmid', 'title', 'abstract')
+    _REVIEW_COLUMNS = ('pmid', 'doi', 'title', 'journal', 'pub_year', 'abstract')
+    _REVIEW_FIELDS = operator.itemgetter(*_REVIEW_COLUMNS)
+    
+    OUTPUT_FILES = ("pubmed_abstracts_rag_documents.json", "pubmed_abstracts_text_chunks.json",
+                    "pubmed_abstracts_for_rag.csv", "pubmed_abstracts_statistics.json")
+    
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
         self.input_dir = self.config.PUBMED_DIR
         self.output_dir = self.config.PUBMED_DIR / "processed"
     
@@ -652,34 +1666,64 @@ class AbstractProcessor:
         """Process all CSV files into RAG format"""
         Logger.section("PROCESSING PUBMED ABSTRACTS FOR RAG")
         
-        # Check if already processed
-        output_file = self.output_dir / "pubmed_abstracts_rag_documents.json"
-        if skip_if_exists and output_file.exists():
-            Logger.info(f"Abstracts already processed: {output_file.name}")
+        # Check if already processed (every output of the last run is complete and no CSV has changed)
+        csv_files = _list_files(self.input_dir, ".csv")
+        manifest = Manifest(self.output_dir)
+        if skip_if_exists and csv_files and manifest.all_current(csv_files):
+            Logger.info("Abstracts already processed: pubmed_abstracts_rag_documents.json")
             Logger.info("Use skip_if_exists=False to reprocess")
             return self._load_existing_stats()
         
         # Load all abstracts
-        abstracts = self._load_all_csvs()
+        abstracts = self._load_all_csvs(csv_files)
         if not abstracts:
             Logger.error("No abstracts found to process")
             return
         
         Logger.info(f"Loaded {len(abstracts):,} abstracts")
         
-        # Create RAG documents
-        documents = self._create_rag_documents(abstracts)
-        Logger.info(f"Created {len(documents):,} RAG documents")
+        # Stream RAG documents and text chunks straight to disk (compact JSON; only the ingester reads them)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        running = AbstractStats()
+        running.add_abstracts(abstracts)
+        
+        with ExitStack() as stack:
+            # Documents and chunks are pure per-abstract transforms; build large corpora in worker processes
+            mapper = map
+            if self.config.ABSTRACT_WORKERS > 1 and len(abstracts) >= self.config.ABSTRACT_PARALLEL_MIN:
+                pool = stack.enter_context(ProcessPoolExecutor(max_workers=self.config.ABSTRACT_WORKERS))
+                mapper = functools.partial(pool.map, chunksize=self.config.ABSTRACT_TASK_SIZE)
+            
+            # One pass over the abstracts fills all three outputs: documents are streamed by
+            # write_array while chunks and review CSV rows are pushed to their files alongside
+            review = csv.writer(stack.enter_context(_atomic_open(
+                self.output_dir / "pubmed_abstracts_for_rag.csv", 'w', newline='', encoding='utf-8',
+                buffering=1 << 20)))
+            review.writerow(self._REVIEW_COLUMNS)
+            chunks = stack.enter_context(JSONArrayWriter(self.output_dir / "pubmed_abstracts_text_chunks.json",
+                                                         pretty=False))
+            total_documents = JSONFile.write_array(
+                self.output_dir / "pubmed_abstracts_rag_documents.json",
+                self._create_rag_documents(abstracts, running, review.writerow, chunks.write, mapper),
+                pretty=False
+            )
+            total_chunks = chunks.count
         
-        # Create text chunks
-        chunks = self._create_text_chunks(abstracts)
-        Logger.info(f"Created {len(chunks):,} text chunks")
+        Logger.success(f"Saved RAG documents ({total_documents:,})")
+        Logger.success(f"Saved text chunks ({total_chunks:,})")
+        Logger.success("Saved CSV for review")
         
         # Generate statistics
-        stats = self._generate_statistics(abstracts, documents, chunks)
+        stats = self._generate_statistics(len(abstracts), running)
         
-        # Save outputs
-        self._save_outputs(documents, chunks, stats, abstracts)
+        # Save remaining outputs
+        self._save_outputs(stats)
+        
+        manifest.reset()
+        for csv_file in csv_files:
+            manifest.record(csv_file, self.OUTPUT_FILES)
+        manifest.save()
         
         Logger.success("Abstract processing complete")
         return stats
@@ -688,180 +1732,172 @@ class AbstractProcessor:
         """Load existing statistics if available"""
         stats_file = self.output_dir / "pubmed_abstracts_statistics.json"
         if stats_file.exists():
-            with open(stats_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return JSONFile.read(stats_file)
         return None
     
-    def _load_all_csvs(self) -> List[Dict]:
+    def _load_all_csvs(self, csv_files: List[Path]) -> List[Dict]:
         """Load abstracts from all CSV files"""
         abstracts = []
-        csv_files = list(self.input_dir.glob("*.csv"))
         
         Logger.info(f"Found {len(csv_files)} CSV files")
         
-        for csv_file in sorted(csv_files):
-            try:
-                with open(csv_file, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    file_abstracts = [row for row in reader if row.get('abstract', '').strip()]
-                    abstracts.extend(file_abstracts)
-                    Logger.info(f"  {csv_file.name}: {len(file_abstracts):,} abstracts")
-            except Exception as e:
-                Logger.warning(f"  {csv_file.name}: Error - {e}")
+        if not csv_files:
+            return abstracts
         
-        return abstracts
-    
-    def _create_rag_documents(self, abstracts: List[Dict]) -> List[Dict]:
-        """Create RAG-optimized documents"""
-        documents = []
+        # Files are independent; read them concurrently, then log and merge in sorted order
+        with ThreadPoolExecutor(max_workers=min(32, len(csv_files))) as pool:
+            results = list(pool.map(self._load_one_csv, csv_files))
         
-        for abstract in abstracts:
-            title = abstract.get('title', '').strip()
-            abstract_text = abstract.get('abstract', '').strip()
-            searchable_text = f"{title}\n\n{abstract_text}"
-            
-            authors_str = abstract.get('authors', '').strip()
-            authors_list = [a.strip() for a in authors_str.split(';') if a.strip()] if authors_str else []
-            
-            doc = {
-                'id': f"PMID:{abstract.get('pmid', '')}",
-                'title': title,
-                'text': searchable_text,
-                'metadata': {
-                    'pmid': abstract.get('pmid', ''),
-                    'doi': abstract.get('doi', ''),
-                    'journal': abstract.get('journal', ''),
-                    'year': abstract.get('pub_year', ''),
-                    'month': abstract.get('pub_month', ''),
-                    'authors': authors_list[:5],
-                    'source': 'pubmed',
-                    'document_type': 'abstract'
-                }
-            }
-            documents.append(doc)
+        for csv_file, (file_abstracts, error) in zip(csv_files, results):
+            if error:
+                Logger.warning(f"  {csv_file.name}: Error - {error}")
+                continue
+            abstracts.extend(file_abstracts)
+            Logger.info(f"  {csv_file.name}: {len(file_abstracts):,} abstracts")
         
-        return documents
+        return abstracts
     
-    def _create_text_chunks(self, abstracts: List[Dict], max_length=1000) -> List[Dict]:
-        """Create embedding-optimized chunks"""
-        chunks = []
-        
-        for abstract in abstracts:
-            pmid = abstract.get('pmid', '')
-            title = abstract.get('title', '').strip()
-            abstract_text = abstract.get('abstract', '').strip()
-            full_text = f"{title}\n\n{abstract_text}"
-            
-            if len(full_text) <= max_length:
-                chunks.append({
-                    'chunk_id': f"PMID:{pmid}_chunk_0",
-                    'pmid': pmid,
-                    'text': full_text,
-                    'chunk_index': 0,
-                    'total_chunks': 1
-                })
-            else:
-                # Split by sentences
-                sentences = re.split(r'(?<=[.!?])\s+', abstract_text)
-                current_chunk = title + "\n\n"
-                chunk_list = []
-                
-                for sent in sentences:
-                    if len(current_chunk) + len(sent) > max_length and len(current_chunk) > len(title) + 2:
-                        chunk_list.append(current_chunk.strip())
-                        current_chunk = title + "\n\n" + sent + " "
-                    else:
-                        current_chunk += sent + " "
-                
-                if current_chunk.strip():
-                    chunk_list.append(current_chunk.strip())
-                
-                for idx, chunk_text in enumerate(chunk_list):
-                    chunks.append({
-                        'chunk_id': f"PMID:{pmid}_chunk_{idx}",
-                        'pmid': pmid,
-                        'text': chunk_text,
-                        'chunk_index': idx,
-                        'total_chunks': len(chunk_list)
-                    })
-        
-        return chunks
+    def _load_one_csv(self, csv_file: Path) -> Tuple[List[Dict], Optional[Exception]]:
+        """Read one CSV, returning the error instead of raising"""
+        try:
+            return self._read_csv(csv_file), None
+        except Exception as e:
+            return [], e
     
-    def _generate_statistics(self, abstracts, documents, chunks) -> Dict:
+    @staticmethod
+    def _read_csv(csv_file: Path) -> List[Dict]:
+        """Read one abstracts CSV, keeping rows with a non-empty abstract"""
+        if not PYARROW_AVAILABLE:
+            with open(csv_file, 'r', encoding='utf-8') as f:
+                reader = csv.DictReader(f, restval='')
+                rows = [row for row in reader if row.get('abstract', '').strip()]
+                columns = reader.fieldnames or []
+        else:
+            # Read every column as text (PMIDs, years etc. must stay strings) and filter in Arrow
+            with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+                columns = next(csv.reader(f), [])
+            if 'abstract' not in columns:
+                return []
+            
+            table = pacsv.read_csv(
+                csv_file,
+                parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                convert_options=pacsv.ConvertOptions(column_types={c: pa.string() for c in columns})
+            )
+            table = table.filter(pc.not_equal(pc.utf8_trim_whitespace(table['abstract']), ''))
+            rows = table.to_pylist()
+        
+        # Older CSVs may lack some columns; fill them so rows can be read with itemgetter
+        missing = [c for c in JournalFetcher.CSV_FIELDS if c not in columns]
+        if missing:
+            for row in rows:
+                row.update(dict.fromkeys(missing, ''))
+        return rows
+    
+    def _create_rag_documents(self, abstracts: List[Dict], running: AbstractStats,
+                              review_row: Callable[[Tuple], object], chunk_sink: Callable[[RagChunk], object],
+                              mapper=map) -> Iterator[RagDoc]:
+        """Create RAG-optimized documents; each abstract's chunks go to chunk_sink and its
+        review CSV row to review_row"""
+        build = functools.partial(_build_abstract_outputs, max_tokens=self.config.CHUNK_MAX_TOKENS)
+        for abstract, (doc, chunks) in zip(abstracts, mapper(build, abstracts)):
+            review_row(self._REVIEW_FIELDS(abstract))
+            for chunk in chunks:
+                running.add_chunk(len(chunk.text))
+                chunk_sink(chunk)
+            yield doc
+    
+    def _generate_statistics(self, total_abstracts: int, running: AbstractStats) -> Dict:
         """Generate processing statistics"""
         stats = {
-            'total_abstracts': len(abstracts),
-            'total_documents': len(documents),
-            'total_chunks': len(chunks),
+            'total_abstracts': total_abstracts,
+            'total_documents': running.documents,
+            'total_chunks': running.chunk_len_n,
             'processing_date': datetime.now().isoformat()
         }
         
-        # Journal distribution
-        journal_counts = defaultdict(int)
-        for a in abstracts:
-            journal_counts[a.get('journal', 'Unknown')] += 1
-        stats['journal_distribution'] = dict(sorted(journal_counts.items(), key=lambda x: x[1], reverse=True))
-        
-        # Year distribution
-        year_counts = defaultdict(int)
-        for a in abstracts:
-            year = a.get('pub_year', '')
-            if year:
-                year_counts[year] += 1
-        stats['year_distribution'] = dict(sorted(year_counts.items()))
+        # Journal and year distributions
+        stats['journal_distribution'] = dict(running.journal_counts.most_common())
+        stats['year_distribution'] = dict(sorted(running.year_counts.items()))
         
         # Text length stats
-        abstract_lengths = [len(a.get('abstract', '')) for a in abstracts]
-        chunk_lengths = [len(c['text']) for c in chunks]
-        
         stats['text_length_stats'] = {
             'abstract': {
-                'min': min(abstract_lengths) if abstract_lengths else 0,
-                'max': max(abstract_lengths) if abstract_lengths else 0,
-                'avg': round(sum(abstract_lengths) / len(abstract_lengths), 1) if abstract_lengths else 0
+                'min': running.abstract_len_min,
+                'max': running.abstract_len_max,
+                'avg': round(running.abstract_len_sum / running.abstract_len_n, 1) if running.abstract_len_n else 0
             },
             'chunk': {
-                'min': min(chunk_lengths) if chunk_lengths else 0,
-                'max': max(chunk_lengths) if chunk_lengths else 0,
-                'avg': round(sum(chunk_lengths) / len(chunk_lengths), 1) if chunk_lengths else 0
+                'min': running.chunk_len_min,
+                'max': running.chunk_len_max,
+                'avg': round(running.chunk_len_sum / running.chunk_len_n, 1) if running.chunk_len_n else 0
             }
         }
         
         return stats
     
-    def _save_outputs(self, documents, chunks, stats, abstracts):
-        """Save all processed outputs"""
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # RAG documents
-        with open(self.output_dir / "pubmed_abstracts_rag_documents.json", 'w', encoding='utf-8') as f:
-            json.dump(documents, f, indent=2, ensure_ascii=False)
-        Logger.success(f"Saved RAG documents ({len(documents):,})")
-        
-        # Text chunks
-        with open(self.output_dir / "pubmed_abstracts_text_chunks.json", 'w', encoding='utf-8') as f:
-            json.dump(chunks, f, indent=2, ensure_ascii=False)
-        Logger.success(f"Saved text chunks ({len(chunks):,})")
-        
-        # Statistics
-        with open(self.output_dir / "pubmed_abstracts_statistics.json", 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2, ensure_ascii=False)
+    def _save_outputs(self, stats):
+        """Save statistics (documents, chunks and the review CSV are streamed in process_all)"""
+        JSONFile.write(self.output_dir / "pubmed_abstracts_statistics.json", stats)
         Logger.success("Saved statistics")
-        
-        # CSV for review
-        with open(self.output_dir / "pubmed_abstracts_for_rag.csv", 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=['pmid', 'doi', 'title', 'journal', 'pub_year', 'abstract'])
-            writer.writeheader()
-            for a in abstracts:
-                writer.writerow({
-                    'pmid': a.get('pmid', ''),
-                    'doi': a.get('doi', ''),
-                    'title': a.get('title', ''),
-                    'journal': a.get('journal', ''),
-                    'pub_year': a.get('pub_year', ''),
-                    'abstract': a.get('abstract', '')
-                })
-        Logger.success("Saved CSV for review")
+
+
+# Abstract documents and chunks may be built in worker processes, so the builders live at module level (picklable)
+
+def _build_abstract_doc(abstract: Dict) -> RagDoc:
+    """RAG document for one abstract"""
+    pmid, doi, title, journal, year, month, authors_str, abstract_text = AbstractProcessor._DOC_FIELDS(abstract)
+    title = title.strip()
+    abstract_text = abstract_text.strip()
+    searchable_text = f"{title}\n\n{abstract_text}"
+    
+    authors_str = authors_str.strip()
+    authors_list = [a.strip() for a in authors_str.split(';') if a.strip()] if authors_str else []
+    
+    return RagDoc(f"PMID:{pmid}", title, searchable_text,
+                  RagMeta(pmid, doi, journal, year, month, authors_list[:5]))
+
+
+def _build_abstract_outputs(abstract: Dict, max_tokens: int = Config.CHUNK_MAX_TOKENS) -> Tuple[RagDoc, List[RagChunk]]:
+    """Document and chunks for one abstract (one round trip per abstract in the process pool)"""
+    return _build_abstract_doc(abstract), _build_abstract_chunks(abstract, max_tokens)
+
+
+def _build_abstract_chunks(abstract: Dict, max_tokens: int = Config.CHUNK_MAX_TOKENS) -> List[RagChunk]:
+    """Embedding chunks for one abstract, split on sentence boundaries"""
+    pmid, title, abstract_text = AbstractProcessor._CHUNK_FIELDS(abstract)
+    title = title.strip()
+    abstract_text = abstract_text.strip()
+    prefix = f"{title}\n\n"  # Repeated at the start of every chunk; built once per abstract
+    full_text = prefix + abstract_text
+    
+    if estimate_tokens(full_text) <= max_tokens:
+        return [RagChunk(f"PMID:{pmid}_chunk_0", pmid, full_text, 0, 1)]
+    
+    # Split by sentences
+    sentences = _split_sentences(abstract_text)
+    title_tokens = estimate_tokens(title)
+    current_parts = [prefix]
+    current_tokens = title_tokens
+    chunk_list = []
+    
+    # Buffer sentences in a list and join on flush instead of growing a string
+    for sent in sentences:
+        sent_tokens = estimate_tokens(sent)
+        if current_tokens + sent_tokens > max_tokens and current_tokens > title_tokens:
+            chunk_list.append(''.join(current_parts).strip())
+            current_parts = [prefix, sent, " "]
+            current_tokens = title_tokens + sent_tokens
+        else:
+            current_parts += (sent, " ")
+            current_tokens += sent_tokens
+    
+    current_chunk = ''.join(current_parts).strip()
+    if current_chunk:
+        chunk_list.append(current_chunk)
+    
+    return [RagChunk(f"PMID:{pmid}_chunk_{idx}", pmid, chunk_text, idx, len(chunk_list))
+            for idx, chunk_text in enumerate(chunk_list)]
 
 
 # ============================================================================
@@ -872,7 +1908,7 @@ class TerminologyProcessor:
     """Processes RadLex and LOINC into RAG format"""
     
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
     
     def process_all(self, skip_if_exists=True):
         """Process both RadLex and LOINC"""
@@ -890,17 +1926,17 @@ class TerminologyProcessor:
         
         output_dir = self.config.RADLEX_DIR / "processed"
         output_file = output_dir / "radlex_rag_documents.json"
+        owl_file = self.config.RADLEX_DIR / "RadLex.owl"
         
         # Check if already processed
-        if skip_if_exists and output_file.exists():
+        manifest = Manifest(output_dir)
+        if skip_if_exists and manifest.is_current(owl_file):
             Logger.info(f"RadLex already processed: {output_file.name}")
-            stats_file = output_dir / "radlex_statistics.json"
-            if stats_file.exists():
-                with open(stats_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return None
+            try:
+                return JSONFile.read(output_dir / "radlex_statistics.json")
+            except FileNotFoundError:
+                return None
         
-        owl_file = self.config.RADLEX_DIR / "RadLex.owl"
         if not owl_file.exists():
             Logger.error(f"RadLex OWL file not found: {owl_file}")
             return None
@@ -915,13 +1951,13 @@ class TerminologyProcessor:
         # Save
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(documents, f, indent=2, ensure_ascii=False)
+        JSONFile.write(output_file, documents)
         
         stats = {'total_terms': len(terms), 'total_documents': len(documents)}
         
-        with open(output_dir / "radlex_statistics.json", 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2)
+        JSONFile.write(output_dir / "radlex_statistics.json", stats)
+        manifest.record(owl_file, [output_file.name, "radlex_statistics.json"])
+        manifest.save()
         
         Logger.success(f"RadLex: {len(terms):,} terms processed")
         return stats
@@ -932,17 +1968,17 @@ class TerminologyProcessor:
         
         output_dir = self.config.LOINC_DIR / "processed"
         output_file = output_dir / "loinc_rag_documents.json"
+        csv_file = self.config.LOINC_DIR / "LoincRsnaRadiologyPlaybook.csv"
         
         # Check if already processed
-        if skip_if_exists and output_file.exists():
+        manifest = Manifest(output_dir)
+        if skip_if_exists and manifest.is_current(csv_file):
             Logger.info(f"LOINC already processed: {output_file.name}")
-            stats_file = output_dir / "loinc_statistics.json"
-            if stats_file.exists():
-                with open(stats_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return None
+            try:
+                return JSONFile.read(output_dir / "loinc_statistics.json")
+            except FileNotFoundError:
+                return None
         
-        csv_file = self.config.LOINC_DIR / "LoincRsnaRadiologyPlaybook.csv"
         if not csv_file.exists():
             Logger.error(f"LOINC CSV not found: {csv_file}")
             return None
@@ -957,13 +1993,13 @@ class TerminologyProcessor:
         # Save
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(documents, f, indent=2, ensure_ascii=False)
+        JSONFile.write(output_file, documents)
         
         stats = {'total_procedures': len(procedures), 'total_documents': len(documents)}
         
-        with open(output_dir / "loinc_statistics.json", 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2)
+        JSONFile.write(output_dir / "loinc_statistics.json", stats)
+        manifest.record(csv_file, [output_file.name, "loinc_statistics.json"])
+        manifest.save()
         
         Logger.success(f"LOINC: {len(procedures):,} procedures processed")
         return stats
@@ -997,7 +2033,7 @@ class PDFProcessor:
     """Processes PDF guidelines into RAG format"""
     
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
     
     def process_all(self, skip_if_exists=True):
         """Process all PDFs in guidelines directory"""
@@ -1007,16 +2043,12 @@ class PDFProcessor:
             Logger.error("No PDF library available. Install: pip install pymupdf")
             return []
         
-        pdf_files = list(self.config.GUIDELINES_DIR.glob("*.pdf"))
+        pdf_files = _list_files(self.config.GUIDELINES_DIR, ".pdf")
         
         if not pdf_files:
             Logger.warning("No PDF files found in guidelines directory")
         
-        results = []
-        for pdf_file in pdf_files:
-            result = self.process_pdf(pdf_file, skip_if_exists, output_dir=self.config.GUIDELINES_DIR / "processed")
-            if result:
-                results.append(result)
+        results = self._process_pdfs(pdf_files, skip_if_exists, self.config.GUIDELINES_DIR / "processed")
         
         Logger.success(f"Processed {len(results)} guideline PDF(s)")
         return results
@@ -1029,22 +2061,51 @@ class PDFProcessor:
             Logger.error("No PDF library available. Install: pip install pymupdf")
             return []
         
-        pdf_files = list(self.config.TNM_DIR.glob("*.pdf"))
+        pdf_files = _list_files(self.config.TNM_DIR, ".pdf")
         
         if not pdf_files:
             Logger.warning("No TNM PDF files found")
             return []
         
-        results = []
-        for pdf_file in pdf_files:
-            result = self.process_pdf(pdf_file, skip_if_exists, output_dir=self.config.TNM_DIR / "processed", doc_type="staging")
-            if result:
-                results.append(result)
+        results = self._process_pdfs(pdf_files, skip_if_exists, self.config.TNM_DIR / "processed", doc_type="staging")
         
         Logger.success(f"Processed {len(results)} TNM staging PDF(s)")
         return results
     
-    def process_pdf(self, pdf_path: Path, skip_if_exists=True, output_dir: Path = None, doc_type: str = "guideline"):
+    def _process_pdfs(self, pdf_files: List[Path], skip_if_exists: bool, output_dir: Path,
+                      doc_type: str = "guideline") -> List[Dict]:
+        """Process several PDFs, one per worker process (pages are then extracted serially)"""
+        # The manifest is read once and only updated here, in the parent process
+        manifest = Manifest(output_dir)
+        skipped, pending = [], []
+        for pdf_file in pdf_files:
+            (skipped if skip_if_exists and manifest.is_current(pdf_file) else pending).append(pdf_file)
+        if skipped:
+            Logger.info(f"Already processed: {len(skipped)} PDF(s)")
+        
+        if len(pending) <= 1 or self.config.PDF_WORKERS <= 1:
+            results = [self.process_pdf(pdf_file, False, output_dir=output_dir, doc_type=doc_type)
+                       for pdf_file in pending]
+        else:
+            workers = min(self.config.PDF_WORKERS, len(pending))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(self.process_pdf, pdf_file, False, output_dir, doc_type,
+                                       parallel_pages=False)
+                           for pdf_file in pending]
+                results = [f.result() for f in futures]
+        
+        for pdf_file, result in zip(pending, results):
+            if result:
+                manifest.record(pdf_file, [f"{pdf_file.stem}_rag_documents.json",
+                                           f"{pdf_file.stem}_statistics.json"])
+        if pending:
+            manifest.save()
+        
+        results = [{'file': pdf_file.name, 'chunks': 'skipped'} for pdf_file in skipped] + results
+        return [r for r in results if r]
+    
+    def process_pdf(self, pdf_path: Path, skip_if_exists=True, output_dir: Path = None, doc_type: str = "guideline",
+                    parallel_pages=True):
         """Process a single PDF file"""
         if output_dir is None:
             output_dir = self.config.GUIDELINES_DIR / "processed"
@@ -1058,20 +2119,16 @@ class PDFProcessor:
         
         Logger.info(f"Processing: {pdf_path.name}")
         
-        # Extract text
-        pages = self._extract_text(pdf_path)
+        # Extract text (and the title/author the PDF declares, read while the file is open anyway)
+        pages, info = self._extract_text(pdf_path, parallel_pages)
         
         # Create chunks
         chunks = self._chunk_by_paragraphs(pages)
         
-        # Create RAG documents
-        documents = self._create_rag_documents(chunks, pdf_path.stem, doc_type)
-        
-        # Save
+        # Create RAG documents and stream them to disk (the document list is never held in memory)
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(documents, f, indent=2, ensure_ascii=False)
+        JSONFile.write_array(output_file, self._create_rag_documents(chunks, pdf_path.stem, doc_type))
         
         # Save statistics
         stats = {
@@ -1079,80 +2136,139 @@ class PDFProcessor:
             'total_pages': len(pages),
             'total_chunks': len(chunks),
             'avg_chunk_size': round(sum(len(c['text']) for c in chunks) / len(chunks), 1) if chunks else 0,
-            'document_type': doc_type
+            'document_type': doc_type,
+            **info
         }
         
-        with open(output_dir / f"{pdf_path.stem}_statistics.json", 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2)
+        JSONFile.write(output_dir / f"{pdf_path.stem}_statistics.json", stats)
         
         Logger.success(f"  {pdf_path.stem}: {len(chunks)} chunks from {len(pages)} pages")
         return {'file': pdf_path.name, 'chunks': len(chunks), 'pages': len(pages)}
     
-    def _extract_text(self, pdf_path: Path) -> List[Dict]:
-        """Extract text from PDF"""
+    def _extract_text(self, pdf_path: Path, parallel_pages=True) -> Tuple[List[Dict], Dict]:
+        """Extract text and document info from PDF, spreading page ranges over worker processes for large files"""
+        step = self.config.PDF_PAGES_PER_TASK
+        serial = not parallel_pages or self.config.PDF_WORKERS <= 1
+        
+        # One open serves the page count, the document info and, unless pages are farmed out, the text
         if PYMUPDF_AVAILABLE:
-            return self._extract_pymupdf(pdf_path)
+            extract = _extract_pages_pymupdf
+            with fitz.open(pdf_path) as doc:
+                page_count = doc.page_count
+                info = _pdf_info(doc.metadata.get('title'), doc.metadata.get('author')) if doc.metadata else {}
+                if serial or page_count <= step:
+                    return _read_pages_pymupdf(doc, 0, page_count), info
         else:
-            return self._extract_pypdf2(pdf_path)
-    
-    def _extract_pymupdf(self, pdf_path: Path) -> List[Dict]:
-        """Extract using PyMuPDF"""
-        pages = []
-        doc = fitz.open(pdf_path)
-        for page_num, page in enumerate(doc, start=1):
-            pages.append({
-                'page_number': page_num,
-                'text': page.get_text().strip()
-            })
-        doc.close()
-        return pages
-    
-    def _extract_pypdf2(self, pdf_path: Path) -> List[Dict]:
-        """Extract using PyPDF2"""
-        pages = []
-        with open(pdf_path, 'rb') as f:
-            reader = PyPDF2.PdfReader(f)
-            for page_num, page in enumerate(reader.pages, start=1):
-                pages.append({
-                    'page_number': page_num,
-                    'text': page.extract_text().strip()
-                })
-        return pages
+            extract = _extract_pages_pypdf2
+            with open(pdf_path, 'rb') as f:
+                reader = PyPDF2.PdfReader(f)
+                page_count = len(reader.pages)
+                info = _pdf_info(reader.metadata.title, reader.metadata.author) if reader.metadata else {}
+                if serial or page_count <= step:
+                    return _read_pages_pypdf2(reader, 0, page_count), info
+        
+        ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+        with ProcessPoolExecutor(max_workers=min(self.config.PDF_WORKERS, len(ranges))) as pool:
+            futures = [pool.submit(extract, pdf_path, start, stop) for start, stop in ranges]
+            return [page for f in futures for page in f.result()], info
     
     def _chunk_by_paragraphs(self, pages: List[Dict]) -> List[Dict]:
-        """Create chunks from paragraphs"""
+        """Create chunks from paragraphs, merging adjacent ones on a page up to the chunk size"""
         chunks = []
-        chunk_id = 0
+        max_chars = self.config.PDF_CHUNK_MAX_CHARS
+        min_chars = self.config.PDF_MIN_CHUNK_CHARS
         
         for page in pages:
-            paragraphs = [p.strip() for p in page['text'].split('\n\n') if p.strip()]
-            
-            for para in paragraphs:
-                if len(para) > 100:  # Only meaningful paragraphs
+            for text in self._merge_paragraphs(page['paragraphs'], max_chars):
+                if len(text) > min_chars:  # Only meaningful chunks
                     chunks.append({
-                        'id': f"chunk_{chunk_id}",
-                        'text': para,
+                        'id': f"chunk_{len(chunks)}",
+                        'text': text,
                         'page': page['page_number']
                     })
-                    chunk_id += 1
         
         return chunks
     
-    def _create_rag_documents(self, chunks: List[Dict], source_name: str, doc_type: str = "guideline") -> List[Dict]:
-        """Create RAG documents from chunks"""
-        documents = []
-        for chunk in chunks:
-            doc = {
-                'id': f"{source_name}_{chunk['id']}",
-                'text': chunk['text'],
-                'metadata': {
-                    'source': source_name,
-                    'type': doc_type,
-                    'page': chunk['page']
-                }
+    @staticmethod
+    def _merge_paragraphs(paragraphs: List[str], max_chars: int) -> Iterator[str]:
+        """Split paragraphs into atoms (the paragraph, or its sentences if it is over max_chars),
+        then greedily merge adjacent atoms into chunks of at most max_chars"""
+        parts, size = [], 0
+        for para in paragraphs:
+            atoms = _SENT_SPLIT.split(para) if len(para) > max_chars else (para,)
+            sep = "\n\n"  # Paragraphs are joined by a blank line, sentences of one paragraph by a space
+            for atom in atoms:
+                if parts and size + len(sep) + len(atom) > max_chars:
+                    yield ''.join(parts)
+                    parts, size = [], 0
+                if parts:
+                    parts.append(sep)
+                    size += len(sep)
+                parts.append(atom)
+                size += len(atom)
+                sep = " "
+        if parts:
+            yield ''.join(parts)
+    
+    _CHUNK_FIELDS = operator.itemgetter('id', 'text', 'page')
+    
+    def _create_rag_documents(self, chunks: List[Dict], source_name: str, doc_type: str = "guideline") -> Iterator[Dict]:
+        """Create RAG documents from chunks (lazily, for streaming to disk)"""
+        # Per-file constants are bound once; each chunk is then a single itemgetter call plus the literals
+        id_prefix = f"{source_name}_"
+        return (
+            {
+                'id': id_prefix + chunk_id,
+                'text': text,
+                'metadata': {'source': source_name, 'type': doc_type, 'page': page}
             }
-            documents.append(doc)
-        return documents
+            for chunk_id, text, page in map(self._CHUNK_FIELDS, chunks)
+        )
+
+
+# PDF page extraction runs in worker processes, so these live at module level (picklable)
+
+def _pdf_info(title: Optional[str], author: Optional[str]) -> Dict:
+    """Title and author declared in the PDF's own metadata (unset or blank fields are left out)"""
+    info = {'title': title, 'author': author}
+    return {key: value.strip() for key, value in info.items() if value and value.strip()}
+
+
+def _read_pages_pymupdf(doc, start: int, stop: int) -> List[Dict]:
+    """Read pages [start, stop) of an open PyMuPDF document, one paragraph per text block"""
+    pages = []
+    for page_num in range(start, stop):
+        # Blocks are (x0, y0, x1, y1, text, block_no, block_type); type 0 is text, 1 is an image
+        blocks = doc[page_num].get_text("blocks")
+        pages.append({
+            'page_number': page_num + 1,
+            'paragraphs': [text for text in (b[4].strip() for b in blocks if b[6] == 0) if text]
+        })
+    return pages
+
+
+def _read_pages_pypdf2(reader, start: int, stop: int) -> List[Dict]:
+    """Read pages [start, stop) of an open PyPDF2 reader (no layout info, so paragraphs are split on blank lines)"""
+    pages = []
+    for page_num in range(start, stop):
+        text = reader.pages[page_num].extract_text()
+        pages.append({
+            'page_number': page_num + 1,
+            'paragraphs': [p.strip() for p in text.split('\n\n') if p.strip()]
+        })
+    return pages
+
+
+def _extract_pages_pymupdf(pdf_path: Path, start: int, stop: int) -> List[Dict]:
+    """Extract pages [start, stop) using PyMuPDF"""
+    with fitz.open(pdf_path) as doc:
+        return _read_pages_pymupdf(doc, start, stop)
+
+
+def _extract_pages_pypdf2(pdf_path: Path, start: int, stop: int) -> List[Dict]:
+    """Extract pages [start, stop) using PyPDF2"""
+    with open(pdf_path, 'rb') as f:
+        return _read_pages_pypdf2(PyPDF2.PdfReader(f), start, stop)
 
 
 # ============================================================================
@@ -1177,10 +2293,8 @@ class DataPipeline:
         Logger.info("Note: LOINC requires manual download from https://loinc.org/downloads/\n")
         
         self.journal_fetcher.fetch_all_journals()
-        self.term_fetcher.fetch_radlex()
         # LOINC requires manual download - not included in automatic fetch
-        self.term_fetcher.fetch_recist()
-        self.term_fetcher.fetch_irecist()
+        self.term_fetcher.fetch_all()
         
         Logger.section("DOWNLOAD COMPLETE")
         Logger.success("All data sources have been downloaded")
@@ -1196,6 +2310,8 @@ class DataPipeline:
         Logger.section("PROCESSING ALL DATA SOURCES")
         Logger.info("Processing downloaded data into RAG-ready format...\n")
         
+        # One source at a time: abstracts and PDFs each size their own process pool to the CPU
+        # count, and forking those workers from a threaded parent can deadlock on inherited locks
         self.abstract_processor.process_all()
         self.term_processor.process_all()
         self.pdf_processor.process_all()
@@ -1294,10 +2410,8 @@ Examples:
         elif cmd == 'fetch-journals':
             pipeline.journal_fetcher.fetch_all_journals()
         elif cmd == 'fetch-terminology':
-            pipeline.term_fetcher.fetch_radlex()
             # LOINC requires manual download
-            pipeline.term_fetcher.fetch_recist()
-            pipeline.term_fetcher.fetch_irecist()
+            pipeline.term_fetcher.fetch_all()
         elif cmd == 'process-all':
             pipeline.process_all()
         elif cmd == 'process-abstracts':
@@ -14,11 +14,104 @@ Usage:
 
 import json
 import csv
+import io
+import re
 import zipfile
 import argparse
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict
-import xml.etree.ElementTree as ET
+from typing import List, Dict, Optional, BinaryIO
+
+# Try to import lxml's C parser for the OWL file (falls back to the stdlib, whose API is the same here)
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
+
+# Try to import faster JSON library for writing outputs (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Namespaces used in the RadLex OWL/RDF-XML
+NAMESPACES = {
+    'owl': 'http://www.w3.org/2002/07/owl#',
+    'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
+    'rdfs': 'http://www.w3.org/2000/01/rdf-schema#',
+    'skos': 'http://www.w3.org/2004/02/skos/core#',
+    'obo': 'http://purl.obolibrary.org/obo/',
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'oboInOwl': 'http://www.geneontology.org/formats/oboInOwl#',
+    'RID': 'http://www.radlex.org/RID/'  # RadLex-specific namespace
+}
+
+OWL_CLASS = '{http://www.w3.org/2002/07/owl#}Class'
+
+# lxml keeps comments and processing instructions as children (their tag is not a string); drop them
+ITERPARSE_OPTIONS = {'remove_comments': True, 'remove_pis': True} if LXML_AVAILABLE else {}
+
+# Tags and attributes read from each owl:Class, in Clark notation so they compare as plain strings
+RDF_ABOUT = f"{{{NAMESPACES['rdf']}}}about"
+RDF_RESOURCE = f"{{{NAMESPACES['rdf']}}}resource"
+RDFS_LABEL = f"{{{NAMESPACES['rdfs']}}}label"
+RDFS_SUBCLASS_OF = f"{{{NAMESPACES['rdfs']}}}subClassOf"
+SKOS_PREF_LABEL = f"{{{NAMESPACES['skos']}}}prefLabel"
+RID_PREFERRED_NAME = f"{{{NAMESPACES['RID']}}}Preferred_name"
+RID_DEFINITION = f"{{{NAMESPACES['RID']}}}Definition"
+RID_SYNONYM = f"{{{NAMESPACES['RID']}}}Synonym"
+RID_ACRONYM = f"{{{NAMESPACES['RID']}}}Acronym"
+
+# Standard-vocabulary fallbacks, in order of preference
+DEFINITION_TAGS = (
+    f"{{{NAMESPACES['skos']}}}definition",
+    f"{{{NAMESPACES['obo']}}}IAO_0000115",
+    f"{{{NAMESPACES['oboInOwl']}}}hasDefinition",
+)
+SYNONYM_TAGS = (
+    f"{{{NAMESPACES['skos']}}}altLabel",
+    f"{{{NAMESPACES['oboInOwl']}}}hasExactSynonym",
+    f"{{{NAMESPACES['oboInOwl']}}}hasSynonym",
+)
+
+# Children of which only the first is used, and tags also searched below the children
+FIRST_CHILD_TAGS = frozenset((RID_PREFERRED_NAME, RID_DEFINITION, RID_ACRONYM, SKOS_PREF_LABEL, RDFS_LABEL))
+DESCENDANT_TAGS = DEFINITION_TAGS + SYNONYM_TAGS + (RDFS_SUBCLASS_OF,)
+
+# OWL/RDF system URIs (not RadLex terms)
+SYSTEM_URIS = ('http://www.w3.org', 'http://purl.org/dc')
+
+# RIDs and labels for the regex fallback used when the OWL is not well-formed XML
+_RID_ABOUT_RE = re.compile(r'rdf:about="[^"]*/(RID\d+)"')
+_RDFS_LABEL_RE = re.compile(r'<rdfs:label[^>]*>([^<]+)</rdfs:label>')
+
+
+def _rid_from_uri(uri: str) -> str:
+    """Local name of a RadLex URI: the part after the last '/', then after the last '#'"""
+    return uri.rpartition('/')[2].rpartition('#')[2]
+
+
+@lru_cache(maxsize=None)
+def _part_type_label(part_type: str) -> str:
+    """Readable name for a Playbook PartTypeName (a closed vocabulary, so each is cleaned once)"""
+    return part_type.replace('Rad.', '').replace('.', ' ')
+
+
+def _write_json(path: Path, obj, indent: bool = True):
+    """Write an object as UTF-8 JSON, indented like json.dump(..., indent=2) or compact"""
+    if ORJSON_AVAILABLE:
+        # Non-str keys: DictReader files an overlong row's extra cells under None, which json writes as "null"
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        data = orjson.dumps(obj, option=option)
+    elif indent:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    else:
+        data = json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    path.write_bytes(data)
 
 
 class LOINCProcessor:
@@ -57,14 +150,9 @@ class LOINCProcessor:
             csv_name = playbook_files[0]
             print(f"📄 Found: {Path(csv_name).name}")
             
-            # Read CSV from zip
-            with zf.open(csv_name) as csv_file:
-                # Decode bytes to text
-                text_file = (line.decode('utf-8') for line in csv_file)
-                reader = csv.DictReader(text_file)
-                
-                for row in reader:
-                    procedures.append(row)
+            # Read CSV from zip, decoding in buffered blocks rather than line by line
+            with zf.open(csv_name) as csv_file, io.TextIOWrapper(csv_file, encoding='utf-8', newline='') as text_file:
+                procedures = list(csv.DictReader(text_file))
         
         print(f"✅ Extracted {len(procedures):,} procedures")
         
@@ -72,23 +160,20 @@ class LOINCProcessor:
         print("\n📝 Creating RAG documents...")
         documents = self._create_rag_documents(procedures)
         
-        # Save full data
+        # Save full data (archival only, so written compact)
         full_output = self.output_dir / "loinc_procedures_full.json"
-        with open(full_output, 'w', encoding='utf-8') as f:
-            json.dump(procedures, f, indent=2, ensure_ascii=False)
+        _write_json(full_output, procedures, indent=False)
         print(f"✅ Saved full data: {full_output.name}")
         
         # Save RAG documents
         rag_output = self.output_dir / "loinc_rag_documents.json"
-        with open(rag_output, 'w', encoding='utf-8') as f:
-            json.dump(documents, f, indent=2, ensure_ascii=False)
+        _write_json(rag_output, documents)
         print(f"✅ Saved RAG documents: {rag_output.name}")
         
         # Save statistics
         stats = self._calculate_statistics(procedures, documents)
         stats_output = self.output_dir / "loinc_statistics.json"
-        with open(stats_output, 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2)
+        _write_json(stats_output, stats)
         print(f"✅ Saved statistics: {stats_output.name}")
         
         # Print statistics
@@ -112,14 +197,17 @@ class LOINCProcessor:
         """
         documents = []
         
-        # Group by LOINC number to aggregate parts
-        from collections import defaultdict
-        loinc_groups = defaultdict(list)
+        # Group by LOINC number to aggregate parts (one hash of the number per row)
+        loinc_groups = {}
         
         for proc in procedures:
             loinc_num = proc.get('LoincNumber', '')
             if loinc_num:
-                loinc_groups[loinc_num].append(proc)
+                group = loinc_groups.get(loinc_num)
+                if group is None:
+                    loinc_groups[loinc_num] = [proc]
+                else:
+                    group.append(proc)
         
         # Create document for each unique LOINC code
         for loinc_num, parts in loinc_groups.items():
@@ -141,12 +229,15 @@ class LOINCProcessor:
             part_types = set()
             
             for part in parts:
-                if part.get('PartName'):
-                    anatomies.add(part['PartName'])
-                if part.get('RID'):
-                    radlex_ids.add(part['RID'])
-                if part.get('PartTypeName'):
-                    part_types.add(part['PartTypeName'])
+                part_name = part.get('PartName')
+                if part_name:
+                    anatomies.add(part_name)
+                rid = part.get('RID')
+                if rid:
+                    radlex_ids.add(rid)
+                part_type = part.get('PartTypeName')
+                if part_type:
+                    part_types.add(part_type)
             
             # Add anatomical info
             if anatomies:
@@ -157,13 +248,15 @@ class LOINCProcessor:
             
             if part_types:
                 # Clean up part types for readability
-                clean_types = [pt.replace('Rad.', '').replace('.', ' ') for pt in part_types]
+                clean_types = map(_part_type_label, part_types)
                 text_parts.append(f"Components: {', '.join(sorted(clean_types))}")
             
+            doc_text = '\n'.join(text_parts)
+            
             # Create document
             doc = {
                 'id': f"LOINC_{loinc_num.replace('-', '_')}",
-                'text': '\n'.join(text_parts),
+                'text': doc_text,
                 'metadata': {
                     'source': 'LOINC_Radiology_Playbook',
                     'type': 'radiology_procedure',
@@ -172,7 +265,7 @@ class LOINCProcessor:
                     'anatomical_parts': list(anatomies),
                     'radlex_ids': list(radlex_ids),
                     'part_count': len(parts),
-                    'char_count': len('\n'.join(text_parts))
+                    'char_count': len(doc_text)
                 }
             }
             
@@ -183,9 +276,9 @@ class LOINCProcessor:
     def _calculate_statistics(self, procedures: List[Dict], documents: List[Dict]) -> Dict:
         """Calculate statistics about the LOINC data"""
         # Get unique part names and RadLex IDs
-        part_names = set(p.get('PartName', '') for p in procedures if p.get('PartName'))
-        radlex_ids = set(p.get('RID', '') for p in procedures if p.get('RID'))
-        part_types = set(p.get('PartTypeName', '') for p in procedures if p.get('PartTypeName'))
+        part_names = set(filter(None, (p.get('PartName') for p in procedures)))
+        radlex_ids = set(filter(None, (p.get('RID') for p in procedures)))
+        part_types = set(filter(None, (p.get('PartTypeName') for p in procedures)))
         
         text_lengths = [len(d['text']) for d in documents]
         
@@ -224,8 +317,7 @@ class RadLexProcessor:
         zip_path = owl_zips[0]
         print(f"\n📦 Extracting from: {zip_path.name}")
         
-        # Extract OWL file
-        owl_content = None
+        # Parse the OWL file straight out of the zip (it is streamed, never read into memory whole)
         with zipfile.ZipFile(zip_path, 'r') as zf:
             owl_files = [f for f in zf.namelist() if f.endswith('.owl')]
             
@@ -234,40 +326,32 @@ class RadLexProcessor:
                 return
             
             owl_name = owl_files[0]
-            print(f"📄 Found: {Path(owl_name).name}")
+            print(f"📄 Found: {Path(owl_name).name} ({zf.getinfo(owl_name).file_size:,} bytes)")
             
-            # Read OWL content
+            # Parse OWL
+            print("\n🔍 Parsing OWL ontology...")
             with zf.open(owl_name) as owl_file:
-                owl_content = owl_file.read()
-        
-        print(f"✅ Extracted OWL file ({len(owl_content):,} bytes)")
-        
-        # Parse OWL
-        print("\n🔍 Parsing OWL ontology...")
-        terms = self._parse_owl(owl_content)
+                terms = self._parse_owl(owl_file)
         print(f"✅ Parsed {len(terms):,} terms")
         
         # Create RAG documents
         print("\n📝 Creating RAG documents...")
         documents = self._create_rag_documents(terms)
         
-        # Save full data
+        # Save full data (archival only, so written compact)
         full_output = self.output_dir / "radlex_terms_full.json"
-        with open(full_output, 'w', encoding='utf-8') as f:
-            json.dump(terms, f, indent=2, ensure_ascii=False)
+        _write_json(full_output, terms, indent=False)
         print(f"✅ Saved full data: {full_output.name}")
         
         # Save RAG documents
         rag_output = self.output_dir / "radlex_rag_documents.json"
-        with open(rag_output, 'w', encoding='utf-8') as f:
-            json.dump(documents, f, indent=2, ensure_ascii=False)
+        _write_json(rag_output, documents)
         print(f"✅ Saved RAG documents: {rag_output.name}")
         
         # Save statistics
         stats = self._calculate_statistics(terms, documents)
         stats_output = self.output_dir / "radlex_statistics.json"
-        with open(stats_output, 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2)
+        _write_json(stats_output, stats)
         print(f"✅ Saved statistics: {stats_output.name}")
         
         # Print statistics
@@ -279,10 +363,13 @@ class RadLexProcessor:
         
         return documents
     
-    def _parse_owl(self, owl_content: bytes) -> List[Dict]:
+    def _parse_owl(self, owl_file: BinaryIO) -> List[Dict]:
         """
         Parse OWL file to extract RadLex terms with hierarchy
         
+        The file is streamed with iterparse: each top-level element is handled as soon as it
+        closes and then dropped, so the whole ontology tree is never held in memory.
+        
         Preserves:
         - Term IDs and labels
         - Definitions
@@ -290,193 +377,40 @@ class RadLexProcessor:
         - Hierarchical relationships (subClassOf)
         """
         terms = []
+        class_count = 0
         
         try:
-            root = ET.fromstring(owl_content)
-            
-            # Define namespaces - including RadLex-specific namespaces
-            namespaces = {
-                'owl': 'http://www.w3.org/2002/07/owl#',
-                'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
-                'rdfs': 'http://www.w3.org/2000/01/rdf-schema#',
-                'skos': 'http://www.w3.org/2004/02/skos/core#',
-                'obo': 'http://purl.obolibrary.org/obo/',
-                'dc': 'http://purl.org/dc/elements/1.1/',
-                'oboInOwl': 'http://www.geneontology.org/formats/oboInOwl#',
-                'RID': 'http://www.radlex.org/RID/'  # RadLex-specific namespace
-            }
-            
             print("   Parsing OWL classes with improved namespace handling...")
             
-            # Find all classes (terms) - try multiple patterns
-            owl_classes = (
-                root.findall('.//owl:Class', namespaces) or 
-                root.findall('.//{http://www.w3.org/2002/07/owl#}Class')
-            )
+            # Start events only track depth; the first one is the rdf:RDF root
+            context = ET.iterparse(owl_file, events=('start', 'end'), **ITERPARSE_OPTIONS)
+            _, root = next(context)
+            depth = 0
             
-            print(f"   Found {len(owl_classes)} OWL classes")
-            
-            for owl_class in owl_classes:
-                # Extract term ID/URI
-                term_id = (
-                    owl_class.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about') or
-                    owl_class.get('rdf:about') or
-                    ''
-                )
-                
-                # Skip OWL/RDF system classes
-                if not term_id or any(x in term_id for x in ['http://www.w3.org', 'http://purl.org/dc']):
+            for event, elem in context:
+                if event == 'start':
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth:
                     continue
                 
-                # Extract RID
-                rid = term_id.split('/')[-1] if '/' in term_id else term_id
-                rid = rid.split('#')[-1] if '#' in rid else rid
-                
-                # Get label - try multiple approaches, prioritizing RadLex Preferred_name
-                label = ''
-                
-                # FIRST: Try RadLex-specific Preferred_name (most descriptive)
-                pref_name = owl_class.find('RID:Preferred_name', namespaces)
-                if pref_name is not None and pref_name.text:
-                    label = pref_name.text.strip()
-                
-                # Try without namespace prefix
-                if not label:
-                    for elem in owl_class:
-                        if 'Preferred_name' in elem.tag:
-                            if elem.text:
-                                label = elem.text.strip()
-                                break
-                
-                # Fallback to standard label fields
-                if not label:
-                    pref_label = owl_class.find('skos:prefLabel', namespaces)
-                    if pref_label is not None and pref_label.text:
-                        label = pref_label.text.strip()
-                
-                # Try rdfs:label (but this usually just has RID code for RadLex)
-                if not label:
-                    label_elem = owl_class.find('rdfs:label', namespaces)
-                    if label_elem is not None and label_elem.text:
-                        label_text = label_elem.text.strip()
-                        # Only use if it's not just the RID
-                        if label_text and not label_text.startswith('RID'):
-                            label = label_text
-                
-                # Get definition - prioritize RadLex Definition field
-                definition = ''
-                
-                # FIRST: Try RadLex-specific Definition
-                def_elem = owl_class.find('RID:Definition', namespaces)
-                if def_elem is not None and def_elem.text:
-                    definition = def_elem.text.strip()
-                
-                # Try without namespace prefix
-                if not definition:
-                    for elem in owl_class:
-                        if 'Definition' in elem.tag:
-                            if elem.text:
-                                definition = elem.text.strip()
-                                break
-                
-                # Fallback to standard definition fields
-                if not definition:
-                    def_patterns = [
-                        'skos:definition',
-                        'obo:IAO_0000115',
-                        'oboInOwl:hasDefinition'
-                    ]
-                    
-                    for pattern in def_patterns:
-                        def_elem = owl_class.find(f'.//{pattern}', namespaces)
-                        if def_elem is not None and def_elem.text:
-                            definition = def_elem.text.strip()
-                            break
-                
-                # Get synonyms - prioritize RadLex Synonym field
-                synonyms = []
-                
-                # FIRST: Try RadLex-specific Synonym
-                for syn_elem in owl_class.findall('RID:Synonym', namespaces):
-                    if syn_elem.text:
-                        syn_text = syn_elem.text.strip()
-                        if syn_text and syn_text not in synonyms:
-                            synonyms.append(syn_text)
-                
-                # Also try Acronym as a synonym
-                acronym_elem = owl_class.find('RID:Acronym', namespaces)
-                if acronym_elem is not None and acronym_elem.text:
-                    acronym = acronym_elem.text.strip()
-                    if acronym and acronym not in synonyms and acronym != label:
-                        synonyms.append(acronym)
-                
-                # Try without namespace prefix
-                for elem in owl_class:
-                    if 'Synonym' in elem.tag:
-                        if elem.text:
-                            syn_text = elem.text.strip()
-                            if syn_text and syn_text not in synonyms:
-                                synonyms.append(syn_text)
-                
-                # Fallback to standard synonym fields
-                syn_patterns = [
-                    'skos:altLabel',
-                    'oboInOwl:hasExactSynonym',
-                    'oboInOwl:hasSynonym'
-                ]
-                
-                for pattern in syn_patterns:
-                    for syn_elem in owl_class.findall(f'.//{pattern}', namespaces):
-                        if syn_elem.text:
-                            syn_text = syn_elem.text.strip()
-                            if syn_text and syn_text not in synonyms:
-                                synonyms.append(syn_text)
-                
-                # Get parent classes (hierarchy)
-                parents = []
-                for subclass_elem in owl_class.findall('.//rdfs:subClassOf', namespaces):
-                    parent_uri = (
-                        subclass_elem.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource') or
-                        subclass_elem.get('rdf:resource') or
-                        ''
-                    )
-                    if parent_uri:
-                        # Skip OWL system classes
-                        if any(x in parent_uri for x in ['http://www.w3.org', 'http://purl.org/dc']):
-                            continue
-                        parent_rid = parent_uri.split('/')[-1]
-                        parent_rid = parent_rid.split('#')[-1]
-                        if parent_rid and parent_rid not in parents:
-                            parents.append(parent_rid)
-                
-                # Also try direct namespace
-                for subclass_elem in owl_class.findall('.//{http://www.w3.org/2000/01/rdf-schema#}subClassOf'):
-                    parent_uri = subclass_elem.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource', '')
-                    if parent_uri:
-                        if any(x in parent_uri for x in ['http://www.w3.org', 'http://purl.org/dc']):
-                            continue
-                        parent_rid = parent_uri.split('/')[-1]
-                        parent_rid = parent_rid.split('#')[-1]
-                        if parent_rid and parent_rid not in parents:
-                            parents.append(parent_rid)
-                
-                # Only include terms with labels or valid RIDs
-                if label or (rid and rid.startswith('RID')):
-                    term = {
-                        'rid': rid,
-                        'label': label if label else rid,  # Use RID as fallback label
-                        'definition': definition,
-                        'synonyms': synonyms,
-                        'parents': parents,
-                        'uri': term_id
-                    }
-                    terms.append(term)
+                # A complete top-level element: its classes (including nested ones) in document order
+                for owl_class in elem.iter(OWL_CLASS):
+                    class_count += 1
+                    term = self._parse_class(owl_class)
+                    if term:
+                        terms.append(term)
+                root.clear()
+            
+            print(f"   Found {class_count} OWL classes")
         
         except ET.ParseError as e:
             print(f"⚠️  Warning: XML parse error: {e}")
             print("   Attempting simplified parsing...")
-            # Fallback: basic parsing
-            terms = self._parse_owl_simple(owl_content)
+            # Fallback: basic parsing over the raw bytes
+            owl_file.seek(0)
+            terms = self._parse_owl_simple(owl_file.read())
         
         # Report parsing statistics
         terms_with_labels = sum(1 for t in terms if t['label'] != t['rid'])
@@ -489,20 +423,158 @@ class RadLexProcessor:
         
         return terms
     
+    def _parse_class(self, owl_class) -> Optional[Dict]:
+        """Extract one RadLex term from an owl:Class element (None for system or unlabelled classes)"""
+        # Extract term ID/URI
+        term_id = owl_class.get(RDF_ABOUT, '')
+        
+        # Skip OWL/RDF system classes
+        if not term_id or any(x in term_id for x in SYSTEM_URIS):
+            return None
+        
+        # Extract RID
+        rid = _rid_from_uri(term_id)
+        
+        # One pass over the children, sorting them by tag. Standard-vocabulary fields and
+        # subClassOf are also collected from deeper elements, as the './/' searches were
+        first = {}
+        rid_synonyms = []
+        any_name = any_definition = None
+        any_synonyms = []
+        below = {tag: [] for tag in DESCENDANT_TAGS}
+        
+        for child in owl_class:
+            tag = child.tag
+            if tag in FIRST_CHILD_TAGS:
+                first.setdefault(tag, child)
+            elif tag == RID_SYNONYM:
+                rid_synonyms.append(child)
+            
+            # Tags matched without namespace prefix: the first one with text wins
+            text = child.text
+            if text:
+                if any_name is None and 'Preferred_name' in tag:
+                    any_name = text
+                if any_definition is None and 'Definition' in tag:
+                    any_definition = text
+                if 'Synonym' in tag:
+                    any_synonyms.append(text)
+            
+            for elem in (child.iter() if len(child) else (child,)):
+                if elem.tag in below:
+                    below[elem.tag].append(elem)
+        
+        # Get label - try multiple approaches, prioritizing RadLex Preferred_name
+        label = ''
+        
+        # FIRST: Try RadLex-specific Preferred_name (most descriptive)
+        pref_name = first.get(RID_PREFERRED_NAME)
+        if pref_name is not None and pref_name.text:
+            label = pref_name.text.strip()
+        
+        # Try without namespace prefix
+        if not label and any_name:
+            label = any_name.strip()
+        
+        # Fallback to standard label fields
+        if not label:
+            pref_label = first.get(SKOS_PREF_LABEL)
+            if pref_label is not None and pref_label.text:
+                label = pref_label.text.strip()
+        
+        # Try rdfs:label (but this usually just has RID code for RadLex)
+        if not label:
+            label_elem = first.get(RDFS_LABEL)
+            if label_elem is not None and label_elem.text:
+                label_text = label_elem.text.strip()
+                # Only use if it's not just the RID
+                if label_text and not label_text.startswith('RID'):
+                    label = label_text
+        
+        # Get definition - prioritize RadLex Definition field
+        definition = ''
+        
+        # FIRST: Try RadLex-specific Definition
+        def_elem = first.get(RID_DEFINITION)
+        if def_elem is not None and def_elem.text:
+            definition = def_elem.text.strip()
+        
+        # Try without namespace prefix
+        if not definition and any_definition:
+            definition = any_definition.strip()
+        
+        # Fallback to standard definition fields
+        if not definition:
+            for tag in DEFINITION_TAGS:
+                def_elems = below[tag]
+                if def_elems and def_elems[0].text:
+                    definition = def_elems[0].text.strip()
+                    break
+        
+        # Get synonyms - prioritize RadLex Synonym field
+        synonyms = {}  # Used as an ordered set: each synonym kept once, in first-seen order
+        
+        # FIRST: Try RadLex-specific Synonym
+        for syn_elem in rid_synonyms:
+            if syn_elem.text:
+                syn_text = syn_elem.text.strip()
+                if syn_text:
+                    synonyms[syn_text] = None
+        
+        # Also try Acronym as a synonym
+        acronym_elem = first.get(RID_ACRONYM)
+        if acronym_elem is not None and acronym_elem.text:
+            acronym = acronym_elem.text.strip()
+            if acronym and acronym != label:
+                synonyms[acronym] = None
+        
+        # Try without namespace prefix
+        for text in any_synonyms:
+            syn_text = text.strip()
+            if syn_text:
+                synonyms[syn_text] = None
+        
+        # Fallback to standard synonym fields
+        for tag in SYNONYM_TAGS:
+            for syn_elem in below[tag]:
+                if syn_elem.text:
+                    syn_text = syn_elem.text.strip()
+                    if syn_text:
+                        synonyms[syn_text] = None
+        
+        # Get parent classes (hierarchy)
+        parents = {}  # Ordered set, as for synonyms
+        for subclass_elem in below[RDFS_SUBCLASS_OF]:
+            parent_uri = subclass_elem.get(RDF_RESOURCE, '')
+            if parent_uri:
+                # Skip OWL system classes
+                if any(x in parent_uri for x in SYSTEM_URIS):
+                    continue
+                parent_rid = _rid_from_uri(parent_uri)
+                if parent_rid:
+                    parents[parent_rid] = None
+        
+        # Only include terms with labels or valid RIDs
+        if label or (rid and rid.startswith('RID')):
+            return {
+                'rid': rid,
+                'label': label if label else rid,  # Use RID as fallback label
+                'definition': definition,
+                'synonyms': list(synonyms),
+                'parents': list(parents),
+                'uri': term_id
+            }
+        return None
+    
     def _parse_owl_simple(self, owl_content: bytes) -> List[Dict]:
         """Simplified OWL parsing as fallback"""
         terms = []
         # Simple regex-based extraction
-        import re
-        
         content_str = owl_content.decode('utf-8', errors='ignore')
         
         # Find RDF IDs and labels
-        rid_pattern = r'rdf:about="[^"]*/(RID\d+)"'
-        label_pattern = r'<rdfs:label[^>]*>([^<]+)</rdfs:label>'
-        
-        rids = re.findall(rid_pattern, content_str)
-        labels = re.findall(label_pattern, content_str)
+        rids = _RID_ABOUT_RE.findall(content_str)
+        labels = _RDFS_LABEL_RE.findall(content_str)
         
         # Pair them up (rough approximation)
         for rid, label in zip(rids[:len(labels)], labels):
@@ -549,10 +621,12 @@ class RadLexProcessor:
             if term.get('parents'):
                 text_parts.append(f"Parent terms: {', '.join(term['parents'])}")
             
+            doc_text = '\n'.join(text_parts)
+            
             # Create document
             doc = {
                 'id': f"RadLex_{term['rid']}",
-                'text': '\n'.join(text_parts),
+                'text': doc_text,
                 'metadata': {
                     'source': 'RadLex_Ontology',
                     'type': 'radiology_term',
@@ -561,7 +635,7 @@ class RadLexProcessor:
                     'has_definition': bool(term.get('definition')),
                     'synonym_count': len(term.get('synonyms', [])),
                     'parent_count': len(term.get('parents', [])),
-                    'char_count': len('\n'.join(text_parts))
+                    'char_count': len(doc_text)
                 }
             }
             
@@ -14,9 +14,16 @@ Usage:
 import json
 import argparse
 from pathlib import Path
-from collections import defaultdict, Counter
+from collections import Counter
 import statistics
 
+# Try to import faster JSON library (falls back to stdlib json, which also accepts bytes)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class RAGDataQA:
     """Quality analysis for RAG documents"""
@@ -41,8 +48,9 @@ class RAGDataQA:
             print(f"⚠️  File not found: {file_path}")
             return []
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # Parse the raw bytes (no text decode step; the PubMed file runs to hundreds of MB)
+        with open(file_path, 'rb') as f:
+            return _json_loads(f.read())
     
     def analyze_source(self, source: str):
         """Comprehensive analysis of a data source"""
@@ -119,12 +127,9 @@ class RAGDataQA:
         print(f"\n🎯 Clustering Potential:")
         
         # Calculate text similarity indicators
-        first_words = Counter()
-        for doc in docs[:1000]:
-            text = doc.get('text', '').strip()
-            if text:
-                first_word = text.split()[0] if text.split() else ''
-                first_words[first_word] += 1
+        first_words = Counter(
+            words[0] for words in (doc.get('text', '').split() for doc in docs[:1000]) if words
+        )
         
         if first_words:
             top_starts = first_words.most_common(10)
@@ -184,9 +189,8 @@ class RAGDataQA:
         
         for doc in docs:
             words = doc.get('text', '').lower().split()
-            for i in range(len(words) - 2):
-                phrase = ' '.join(words[i:i+3])
-                phrase_counter[phrase] += 1
+            # Count every 3-word window in one C-level update
+            phrase_counter.update(map(' '.join, zip(words, words[1:], words[2:])))
         
         return [(p, c) for p, c in phrase_counter.most_common(top_n) if c > 2]
     
@@ -15,9 +15,9 @@ Usage:
 import re
 import json
 import argparse
+import operator
 from pathlib import Path
 from typing import List, Dict, Tuple
-from collections import defaultdict
 
 try:
     import fitz  # PyMuPDF
@@ -25,6 +25,59 @@ try:
 except ImportError:
     PYMUPDF_AVAILABLE = False
 
+# Try to import faster JSON library (falls back to stdlib json, which also accepts bytes)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _json_loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _json_loads = json.loads
+
+
+def _read_json(path: Path):
+    """Parse a JSON file from its raw bytes"""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _write_json(path: Path, obj):
+    """Write an object as indented UTF-8 JSON (same layout as json.dump(..., indent=2))"""
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    path.write_bytes(data)
+
+
+# Header patterns, compiled once for the per-line structure detection
+_NUMBERED_ANY_RE = re.compile(r'^(\d+\.)+\s+([A-Z].+)')
+
+# One alternation for the cancer-type, appendix and numbered header patterns, so each line costs a
+# single match() (m.lastgroup says which one hit). The numbered group keeps only the last "N." of
+# the prefix, as the separate pattern's repeated group did
+_SECTION_HEADER_RE = re.compile(
+    r'(?P<tnm>(?i:[A-Z][a-zA-Z\s]+(?:Cancer|Tumors?|Mesothelioma|Carcinoma)\s+(?:T|N|M|TNM)\s+(?:Classification|Deﬁnitions?|Stages?)))'
+    r'|(?P<appendix>(?i:Appendix\s+[IVX]+))'
+    r'|(?:\d+\.)*(?P<numbered>\d+\.)\s+[A-Z][a-zA-Z].+'
+    r'|(?P<cancer>[A-Z][a-zA-Z\s]+(?:Cancer|Tumors?|Mesothelioma|Carcinoma))'
+)
+
+_MAJOR_KEYWORDS = frozenset([
+    'BACKGROUND', 'METHODS', 'RESULTS', 'DISCUSSION',
+    'SUMMARY', 'CONCLUSION', 'REFERENCES'
+])
+
+_HEADER_KEYWORDS = (
+    'INTRODUCTION', 'BACKGROUND', 'METHODS', 'RESULTS', 'DISCUSSION',
+    'SUMMARY', 'CONCLUSION', 'OBJECTIVES', 'CRITERIA', 'DEFINITIONS',
+    'ASSESSMENT', 'EVALUATION', 'MEASUREMENT', 'GUIDELINES', 'STAGING',
+    'CLASSIFICATION', 'APPENDIX'
+)
+
+# Chunk fields copied into RAG documents
+_CHUNK_FIELDS = operator.itemgetter('id', 'text', 'page', 'section', 'subsection', 'char_count')
+
 
 class SemanticChunker:
     """Semantic-aware chunking for structured medical documents"""
@@ -52,13 +105,12 @@ class SemanticChunker:
         for page in pages:
             page_num = page['page_number']
             text = page['text']
-            lines = text.split('\n')
             
             current_section = None
             current_subsection = None
             buffer = []
             
-            for i, line in enumerate(lines):
+            for line in text.split('\n'):
                 line_stripped = line.strip()
                 
                 # Skip truly empty lines
@@ -68,7 +120,7 @@ class SemanticChunker:
                     continue
                 
                 # Detect MAJOR headers only (be conservative)
-                header_info = self._detect_major_header(line_stripped, lines[max(0, i-1):min(len(lines), i+3)])
+                header_info = self._detect_major_header(line_stripped)
                 
                 if header_info:
                     # Save previous buffer if exists
@@ -123,7 +175,7 @@ class SemanticChunker:
         
         return structured_elements
     
-    def _detect_major_header(self, line: str, context: List[str]) -> Dict:
+    def _detect_major_header(self, line: str) -> Dict:
         """
         Detect MAJOR headers only (conservative approach to avoid false positives)
         
@@ -138,28 +190,29 @@ class SemanticChunker:
         if 'INTERNATIONAL ASSOCIATION' in line or line.startswith('E U R O P E A N'):
             return None
         
-        # TNM-specific: Cancer type + staging component (e.g., "Lung Cancer T Classification")
-        tnm_pattern = re.match(r'^([A-Z][a-zA-Z\s]+(?:Cancer|Tumors?|Mesothelioma|Carcinoma))\s+(T|N|M|TNM)\s+(Classification|Deﬁnitions?|Stages?)', line, re.IGNORECASE)
-        if tnm_pattern:
-            return {'level': 1, 'pattern': 'tnm_cancer_type'}
-        
-        # TNM-specific: Just cancer type section (e.g., "Thymic Epithelial Tumors–9th Edition")
-        cancer_type_pattern = re.match(r'^([A-Z][a-zA-Z\s]+(?:Cancer|Tumors?|Mesothelioma|Carcinoma))', line)
-        if cancer_type_pattern and ('–9th Edition' in line or 'Classification' in line or len(line.split()) <= 6):
-            return {'level': 1, 'pattern': 'tnm_cancer_type'}
-        
-        # Numbered sections at start of line (e.g., "1. Background", "3.1.1. Measurable")
-        # Must be followed by a capital letter word (not just numbers)
-        numbered_match = re.match(r'^(\d+\.)+\s+([A-Z][a-zA-Z].+)', line)
-        if numbered_match:
-            # Exclude reference citations (they typically end with a period or are very long)
-            if not line.endswith('.') or len(line) < 80:
-                level = min(numbered_match.group(1).count('.'), 3)
-                return {'level': level, 'pattern': 'numbered'}
-        
-        # Appendix headers
-        if re.match(r'^Appendix\s+[IVX]+', line, re.IGNORECASE):
-            return {'level': 1, 'pattern': 'appendix'}
+        header_match = _SECTION_HEADER_RE.match(line)
+        if header_match:
+            kind = header_match.lastgroup
+            
+            # TNM-specific: Cancer type + staging component (e.g., "Lung Cancer T Classification")
+            if kind == 'tnm':
+                return {'level': 1, 'pattern': 'tnm_cancer_type'}
+            
+            # Appendix headers
+            if kind == 'appendix':
+                return {'level': 1, 'pattern': 'appendix'}
+            
+            # Numbered sections at start of line (e.g., "1. Background", "3.1.1. Measurable")
+            # Must be followed by a capital letter word (not just numbers)
+            if kind == 'numbered':
+                # Exclude reference citations (they typically end with a period or are very long)
+                if not line.endswith('.') or len(line) < 80:
+                    level = min(header_match.group('numbered').count('.'), 3)
+                    return {'level': level, 'pattern': 'numbered'}
+            
+            # TNM-specific: Just cancer type section (e.g., "Thymic Epithelial Tumors–9th Edition")
+            elif '–9th Edition' in line or 'Classification' in line or len(line.split()) <= 6:
+                return {'level': 1, 'pattern': 'tnm_cancer_type'}
         
         # ALL CAPS multi-word headers (but not single words and not too long)
         if (line.isupper() and 
@@ -169,13 +222,8 @@ class SemanticChunker:
             return {'level': 1, 'pattern': 'all_caps'}
         
         # Specific major section keywords
-        major_keywords = [
-            'BACKGROUND', 'METHODS', 'RESULTS', 'DISCUSSION',
-            'SUMMARY', 'CONCLUSION', 'REFERENCES'
-        ]
-        
         line_upper = line.upper().strip()
-        if line_upper in major_keywords:
+        if line_upper in _MAJOR_KEYWORDS:
             return {'level': 1, 'pattern': 'keyword'}
         
         return None
@@ -195,21 +243,14 @@ class SemanticChunker:
             return {'level': 1, 'pattern': 'all_caps'}
         
         # Numbered sections
-        numbered_match = re.match(r'^(\d+\.)+\s+([A-Z].+)', line)
+        numbered_match = _NUMBERED_ANY_RE.match(line)
         if numbered_match:
             level = numbered_match.group(1).count('.')
             return {'level': min(level, 3), 'pattern': 'numbered'}
         
         # Common medical document headers
-        header_keywords = [
-            'INTRODUCTION', 'BACKGROUND', 'METHODS', 'RESULTS', 'DISCUSSION',
-            'SUMMARY', 'CONCLUSION', 'OBJECTIVES', 'CRITERIA', 'DEFINITIONS',
-            'ASSESSMENT', 'EVALUATION', 'MEASUREMENT', 'GUIDELINES', 'STAGING',
-            'CLASSIFICATION', 'APPENDIX'
-        ]
-        
         line_upper = line.upper()
-        for keyword in header_keywords:
+        for keyword in _HEADER_KEYWORDS:
             if keyword in line_upper and len(line.split()) <= 5:
                 return {'level': 1, 'pattern': 'keyword'}
         
@@ -273,10 +314,12 @@ class SemanticChunker:
                 # Build the complete section text with header
                 if section_content:
                     # Start with header as context
-                    full_section_text = f"{section_header}\n\n" + '\n\n'.join(section_content)
+                    # Length of header + blank line + paragraphs joined by blank lines, without building the text
+                    section_length = len(section_header) + sum(map(len, section_content)) + 2 * len(section_content)
                     
                     # If section fits in one chunk, use it directly
-                    if len(full_section_text) <= self.max_chunk_size:
+                    if section_length <= self.max_chunk_size:
+                        full_section_text = f"{section_header}\n\n" + '\n\n'.join(section_content)
                         chunks.append({
                             'id': f"chunk_{chunk_id}",
                             'text': full_section_text,
@@ -289,11 +332,11 @@ class SemanticChunker:
                     else:
                         # Section too large - split intelligently
                         # Strategy: Split at paragraph boundaries while keeping header context
-                        paragraphs = full_section_text.split('\n\n')
+                        paragraphs = [para for content in section_content for para in content.split('\n\n')]
                         current_chunk = [section_header]  # Always start with header
                         current_length = len(section_header) + 2
                         
-                        for para in paragraphs[1:]:  # Skip header (already added)
+                        for para in paragraphs:  # Header already added
                             para_len = len(para)
                             
                             # If adding this paragraph would exceed limit
@@ -417,30 +460,29 @@ class SemanticChunker:
             print(f"   Size: {chunk['char_count']} chars")
             print(f"   Preview: {chunk['text'][:150]}...")
         
-        # Create RAG documents
-        documents = []
-        for chunk in chunks:
-            doc = {
-                'id': f"RECIST_1.1_EORTC_{chunk['id']}",
-                'text': chunk['text'],
+        # Create RAG documents (one itemgetter call per chunk, then dict literals)
+        documents = [
+            {
+                'id': f"RECIST_1.1_EORTC_{chunk_id}",
+                'text': text,
                 'metadata': {
                     'source': 'RECIST_1.1_EORTC',
                     'type': 'guideline',
-                    'page': chunk['page'],
-                    'section': chunk['section'],
-                    'subsection': chunk['subsection'],
+                    'page': page,
+                    'section': section,
+                    'subsection': subsection,
                     'chunking_method': 'semantic',
-                    'char_count': chunk['char_count']
+                    'char_count': char_count
                 }
             }
-            documents.append(doc)
+            for chunk_id, text, page, section, subsection, char_count in map(_CHUNK_FIELDS, chunks)
+        ]
         
         # Save
         output_dir.mkdir(parents=True, exist_ok=True)
         output_file = output_dir / "RECIST_1.1_EORTC_rag_documents_semantic.json"
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(documents, f, indent=2, ensure_ascii=False)
+        _write_json(output_file, documents)
         
         # Save statistics
         stats = {
@@ -454,8 +496,7 @@ class SemanticChunker:
             'max_chunk_size': max(chunk_sizes)
         }
         
-        with open(output_dir / "RECIST_1.1_EORTC_statistics_semantic.json", 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2)
+        _write_json(output_dir / "RECIST_1.1_EORTC_statistics_semantic.json", stats)
         
         print(f"\n✅ Saved: {output_file.name}")
         print(f"✅ Semantic chunking complete!")
@@ -507,30 +548,29 @@ class SemanticChunker:
         print(f"   Max size: {max(chunk_sizes):,} chars")
         print(f"   Mean size: {sum(chunk_sizes)/len(chunks):.0f} chars")
         
-        # Create RAG documents
-        documents = []
-        for chunk in chunks:
-            doc = {
-                'id': f"TNM_9th_Edition_{chunk['id']}",
-                'text': chunk['text'],
+        # Create RAG documents (one itemgetter call per chunk, then dict literals)
+        documents = [
+            {
+                'id': f"TNM_9th_Edition_{chunk_id}",
+                'text': text,
                 'metadata': {
                     'source': 'TNM_9th_Edition_2024',
                     'type': 'staging',
-                    'page': chunk['page'],
-                    'cancer_site': chunk['section'],
-                    'staging_component': chunk['subsection'],
+                    'page': page,
+                    'cancer_site': section,
+                    'staging_component': subsection,
                     'chunking_method': 'semantic',
-                    'char_count': chunk['char_count']
+                    'char_count': char_count
                 }
             }
-            documents.append(doc)
+            for chunk_id, text, page, section, subsection, char_count in map(_CHUNK_FIELDS, chunks)
+        ]
         
         # Save
         output_dir.mkdir(parents=True, exist_ok=True)
         output_file = output_dir / "Lung_Protocol_9th_Edition_rag_documents_semantic.json"
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(documents, f, indent=2, ensure_ascii=False)
+        _write_json(output_file, documents)
         
         stats = {
             'source_file': pdf_path.name,
@@ -541,8 +581,7 @@ class SemanticChunker:
             'avg_chunk_size': sum(chunk_sizes) / len(chunks)
         }
         
-        with open(output_dir / "Lung_Protocol_9th_Edition_statistics_semantic.json", 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2)
+        _write_json(output_dir / "Lung_Protocol_9th_Edition_statistics_semantic.json", stats)
         
         print(f"\n✅ Saved: {output_file.name}")
         print(f"✅ Semantic chunking complete!")
@@ -581,11 +620,8 @@ def compare_chunking_methods():
         print("❌ Need both versions to compare")
         return
     
-    with open(para_file) as f:
-        para_docs = json.load(f)
-    
-    with open(sem_file) as f:
-        sem_docs = json.load(f)
+    para_docs = _read_json(para_file)
+    sem_docs = _read_json(sem_file)
     
     print(f"\n📊 Chunk Count:")
     print(f"   Paragraph method: {len(para_docs)} chunks")
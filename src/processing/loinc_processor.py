@@ -6,18 +6,40 @@ LOINC Processing Strategy:
 """
 
 import csv
+import io
 import zipfile
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, BinaryIO
 import json
 from datetime import datetime
 
+# Try to import Arrow's native CSV reader (falls back to csv.DictReader)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
 from models.chunk import Chunk
 
 
+# Playbook columns used to build chunks (with pyarrow, the others are never converted)
+PLAYBOOK_COLUMNS = frozenset((
+    'LoincNumber', 'LongCommonName', 'ShortName', 'PartName', 'RID', 'PartTypeName', 'Property'
+))
+
+
+@lru_cache(maxsize=None)
+def _part_type_label(part_type: str) -> str:
+    """Readable name for a Playbook PartTypeName (a closed vocabulary, so each is cleaned once)"""
+    return part_type.replace('Rad.', '').replace('.', ' ').strip()
+
+
 class LOINCProcessor:
     """Process LOINC Radiology Playbook into structured chunks"""
     
@@ -60,9 +82,8 @@ class LOINCProcessor:
         if self.playbook_file and self.playbook_file.exists():
             # Load from extracted file
             print(f"   Loading from: {self.playbook_file}")
-            with open(self.playbook_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                procedures = list(reader)
+            with open(self.playbook_file, 'rb') as csv_file:
+                procedures = self._read_playbook(csv_file)
         
         elif self.zip_file and self.zip_file.exists():
             # Extract and load from zip
@@ -79,9 +100,7 @@ class LOINCProcessor:
                 
                 # Read CSV from zip
                 with zf.open(csv_name) as csv_file:
-                    text_file = (line.decode('utf-8') for line in csv_file)
-                    reader = csv.DictReader(text_file)
-                    procedures = list(reader)
+                    procedures = self._read_playbook(csv_file)
         
         else:
             raise FileNotFoundError(f"No LOINC data found in {self.loinc_dir}")
@@ -90,6 +109,34 @@ class LOINCProcessor:
         
         return procedures
     
+    @staticmethod
+    def _read_playbook(csv_file: BinaryIO) -> List[Dict]:
+        """
+        Read Playbook rows from a seekable binary CSV stream, every value as text.
+        
+        With pyarrow, Arrow's native reader parses the file and only the columns
+        used for chunks are turned into Python strings.
+        """
+        text_file = io.TextIOWrapper(csv_file, encoding='utf-8', newline='')
+        if not PYARROW_AVAILABLE:
+            return list(csv.DictReader(text_file))
+        
+        columns = [c for c in next(csv.reader(text_file), []) if c in PLAYBOOK_COLUMNS]
+        text_file.detach()  # Keep csv_file open for Arrow
+        if not columns:
+            return []
+        
+        csv_file.seek(0)
+        table = pacsv.read_csv(
+            csv_file,
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=columns,
+                column_types={c: pa.string() for c in columns}
+            )
+        )
+        return table.to_pylist()
+    
     def process(self) -> List[Chunk]:
         """
         Process LOINC codes into chunks.
@@ -109,14 +156,17 @@ class LOINCProcessor:
         # Load procedures
         procedures = self.load_loinc()
         
-        # Group by LOINC number to aggregate parts
-        from collections import defaultdict
-        loinc_groups = defaultdict(list)
+        # Group by LOINC number to aggregate parts (one hash of the number per row)
+        loinc_groups = {}
         
         for proc in procedures:
             loinc_num = proc.get('LoincNumber', '')
             if loinc_num:
-                loinc_groups[loinc_num].append(proc)
+                group = loinc_groups.get(loinc_num)
+                if group is None:
+                    loinc_groups[loinc_num] = [proc]
+                else:
+                    group.append(proc)
         
         print(f"   Grouped into {len(loinc_groups):,} unique LOINC codes")
         
@@ -143,12 +193,15 @@ class LOINCProcessor:
             part_types = set()
             
             for part in parts:
-                if part.get('PartName'):
-                    anatomies.add(part['PartName'])
-                if part.get('RID'):
-                    radlex_ids.add(part['RID'])
-                if part.get('PartTypeName'):
-                    part_types.add(part['PartTypeName'])
+                part_name = part.get('PartName')
+                if part_name:
+                    anatomies.add(part_name)
+                rid = part.get('RID')
+                if rid:
+                    radlex_ids.add(rid)
+                part_type = part.get('PartTypeName')
+                if part_type:
+                    part_types.add(part_type)
             
             # Add anatomical info
             if anatomies:
@@ -160,7 +213,7 @@ class LOINCProcessor:
             
             # Add component types
             if part_types:
-                clean_types = [pt.replace('Rad.', '').replace('.', ' ').strip() for pt in part_types]
+                clean_types = map(_part_type_label, part_types)
                 text_parts.append(f"System: {', '.join(sorted(clean_types))}")
             
             # Additional fields if available
@@ -30,6 +30,28 @@ sys.path.append(str(Path(__file__).parent.parent))
 from models.chunk import Chunk
 
 
+# Header patterns, compiled once for the per-line structure detection
+_NUMBERED_HEADER_RE = re.compile(r'^(\d+\.)+\s+([A-Z][a-zA-Z].+)')
+
+# One alternation for the cancer-type, appendix and numbered header patterns, so each line costs a
+# single match() (m.lastgroup says which one hit). The numbered group keeps only the last "N." of
+# the prefix, as the separate pattern's repeated group did
+_SECTION_HEADER_RE = re.compile(
+    r'(?P<tnm>(?i:[A-Z][a-zA-Z\s]+(?:Cancer|Tumors?|Mesothelioma|Carcinoma)\s+(?:T|N|M|TNM)\s+(?:Classification|Definitions?|Stages?)))'
+    r'|(?P<appendix>(?i:Appendix\s+[IVX]+))'
+    r'|(?:\d+\.)*(?P<numbered>\d+\.)\s+[A-Z][a-zA-Z].+'
+    r'|(?P<cancer>[A-Z][a-zA-Z\s]+(?:Cancer|Tumors?|Mesothelioma|Carcinoma))'
+)
+
+# Key RECIST section keywords
+_RECIST_KEYWORDS = frozenset([
+    'INTRODUCTION', 'BACKGROUND', 'METHODS', 'ASSESSMENT', 'MEASUREMENT',
+    'TARGET LESIONS', 'NON-TARGET LESIONS', 'RESPONSE CRITERIA',
+    'COMPLETE RESPONSE', 'PARTIAL RESPONSE', 'PROGRESSIVE DISEASE',
+    'STABLE DISEASE'
+])
+
+
 class TNMProcessor:
     """
     Process TNM 9th Edition Lung Cancer Protocol PDF into structured chunks.
@@ -70,13 +92,12 @@ class TNMProcessor:
         for page in pages:
             page_num = page['page_number']
             text = page['text']
-            lines = text.split('\n')
             
             current_section = None
             current_subsection = None
             buffer = []
             
-            for i, line in enumerate(lines):
+            for line in text.split('\n'):
                 line_stripped = line.strip()
                 
                 # Skip truly empty lines
@@ -86,7 +107,7 @@ class TNMProcessor:
                     continue
                 
                 # Detect major headers (cancer types, staging components)
-                header_info = self._detect_tnm_header(line_stripped, lines[max(0, i-1):min(len(lines), i+3)])
+                header_info = self._detect_tnm_header(line_stripped)
                 
                 if header_info:
                     # Save previous buffer if exists
@@ -137,36 +158,34 @@ class TNMProcessor:
         
         return structured_elements
     
-    def _detect_tnm_header(self, line: str, context: List[str]) -> Dict:
+    def _detect_tnm_header(self, line: str) -> Dict:
         """Detect TNM-specific headers (cancer types and staging components)"""
         
         # Skip organization headers
         if 'INTERNATIONAL ASSOCIATION' in line or line.startswith('E U R O P E A N'):
             return None
         
-        # Cancer type + staging component
-        tnm_pattern = re.match(
-            r'^([A-Z][a-zA-Z\s]+(?:Cancer|Tumors?|Mesothelioma|Carcinoma))\s+(T|N|M|TNM)\s+(Classification|Definitions?|Stages?)',
-            line, re.IGNORECASE
-        )
-        if tnm_pattern:
-            return {'level': 1, 'pattern': 'tnm_cancer_type'}
-        
-        # Just cancer type section
-        cancer_type_pattern = re.match(r'^([A-Z][a-zA-Z\s]+(?:Cancer|Tumors?|Mesothelioma|Carcinoma))', line)
-        if cancer_type_pattern and ('–9th Edition' in line or 'Classification' in line or len(line.split()) <= 6):
-            return {'level': 1, 'pattern': 'tnm_cancer_type'}
-        
-        # Numbered sections
-        numbered_match = re.match(r'^(\d+\.)+\s+([A-Z][a-zA-Z].+)', line)
-        if numbered_match:
-            if not line.endswith('.') or len(line) < 80:
-                level = min(numbered_match.group(1).count('.'), 3)
-                return {'level': level, 'pattern': 'numbered'}
-        
-        # Appendix headers
-        if re.match(r'^Appendix\s+[IVX]+', line, re.IGNORECASE):
-            return {'level': 1, 'pattern': 'appendix'}
+        header_match = _SECTION_HEADER_RE.match(line)
+        if header_match:
+            kind = header_match.lastgroup
+            
+            # Cancer type + staging component
+            if kind == 'tnm':
+                return {'level': 1, 'pattern': 'tnm_cancer_type'}
+            
+            # Appendix headers
+            if kind == 'appendix':
+                return {'level': 1, 'pattern': 'appendix'}
+            
+            # Numbered sections
+            if kind == 'numbered':
+                if not line.endswith('.') or len(line) < 80:
+                    level = min(header_match.group('numbered').count('.'), 3)
+                    return {'level': level, 'pattern': 'numbered'}
+            
+            # Just cancer type section
+            elif '–9th Edition' in line or 'Classification' in line or len(line.split()) <= 6:
+                return {'level': 1, 'pattern': 'tnm_cancer_type'}
         
         # ALL CAPS multi-word headers
         if (line.isupper() and 
@@ -214,10 +233,12 @@ class TNMProcessor:
                 
                 # Build complete section text with header
                 if section_content:
-                    full_section_text = f"{section_header}\n\n" + '\n\n'.join(section_content)
+                    # Length of header + blank line + paragraphs joined by blank lines, without building the text
+                    section_length = len(section_header) + sum(map(len, section_content)) + 2 * len(section_content)
                     
                     # If section fits in one chunk, use it directly
-                    if len(full_section_text) <= 3000:
+                    if section_length <= 3000:
+                        full_section_text = f"{section_header}\n\n" + '\n\n'.join(section_content)
                         chunks.append({
                             'id': f"chunk_{chunk_id}",
                             'text': full_section_text,
@@ -229,11 +250,11 @@ class TNMProcessor:
                         chunk_id += 1
                     else:
                         # Split at paragraph boundaries while keeping header context
-                        paragraphs = full_section_text.split('\n\n')
+                        paragraphs = [para for content in section_content for para in content.split('\n\n')]
                         current_chunk = [section_header]
                         current_length = len(section_header) + 2
                         
-                        for para in paragraphs[1:]:
+                        for para in paragraphs:
                             para_len = len(para)
                             
                             if current_length + para_len + 2 > 3000:
@@ -408,13 +429,12 @@ class RECISTProcessor:
         for page in pages:
             page_num = page['page_number']
             text = page['text']
-            lines = text.split('\n')
             
             current_section = None
             current_subsection = None
             buffer = []
             
-            for i, line in enumerate(lines):
+            for line in text.split('\n'):
                 line_stripped = line.strip()
                 
                 if not line_stripped:
@@ -478,7 +498,7 @@ class RECISTProcessor:
         """Detect RECIST-specific headers"""
         
         # Numbered sections
-        numbered_match = re.match(r'^(\d+\.)+\s+([A-Z][a-zA-Z].+)', line)
+        numbered_match = _NUMBERED_HEADER_RE.match(line)
         if numbered_match:
             if not line.endswith('.') or len(line) < 80:
                 level = min(numbered_match.group(1).count('.'), 3)
@@ -492,15 +512,8 @@ class RECISTProcessor:
             return {'level': 1, 'pattern': 'all_caps'}
         
         # Key RECIST section keywords
-        keywords = [
-            'INTRODUCTION', 'BACKGROUND', 'METHODS', 'ASSESSMENT', 'MEASUREMENT',
-            'TARGET LESIONS', 'NON-TARGET LESIONS', 'RESPONSE CRITERIA',
-            'COMPLETE RESPONSE', 'PARTIAL RESPONSE', 'PROGRESSIVE DISEASE',
-            'STABLE DISEASE'
-        ]
-        
         line_upper = line.upper().strip()
-        if line_upper in keywords:
+        if line_upper in _RECIST_KEYWORDS:
             return {'level': 1, 'pattern': 'keyword'}
         
         return None
@@ -538,9 +551,11 @@ class RECISTProcessor:
                     i += 1
                 
                 if section_content:
-                    full_section_text = f"{section_header}\n\n" + '\n\n'.join(section_content)
+                    # Length of header + blank line + paragraphs joined by blank lines, without building the text
+                    section_length = len(section_header) + sum(map(len, section_content)) + 2 * len(section_content)
                     
-                    if len(full_section_text) <= 3000:
+                    if section_length <= 3000:
+                        full_section_text = f"{section_header}\n\n" + '\n\n'.join(section_content)
                         chunks.append({
                             'id': f"chunk_{chunk_id}",
                             'text': full_section_text,
@@ -552,11 +567,11 @@ class RECISTProcessor:
                         chunk_id += 1
                     else:
                         # Split intelligently
-                        paragraphs = full_section_text.split('\n\n')
+                        paragraphs = [para for content in section_content for para in content.split('\n\n')]
                         current_chunk = [section_header]
                         current_length = len(section_header) + 2
                         
-                        for para in paragraphs[1:]:
+                        for para in paragraphs:
                             para_len = len(para)
                             
                             if current_length + para_len + 2 > 3000:
@@ -5,18 +5,64 @@ RadLex Processing Strategy:
 - Preserve hierarchical relationships in metadata
 """
 
-import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 import json
 from datetime import datetime
 
+# Try to import lxml's C parser for the OWL file (falls back to the stdlib, whose API is the same here)
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
+
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
 from models.chunk import Chunk
 
 
+# Namespaces used in the RadLex OWL/RDF-XML
+NAMESPACES = {
+    'owl': 'http://www.w3.org/2002/07/owl#',
+    'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
+    'rdfs': 'http://www.w3.org/2000/01/rdf-schema#',
+    'skos': 'http://www.w3.org/2004/02/skos/core#',
+    'obo': 'http://purl.obolibrary.org/obo/',
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'oboInOwl': 'http://www.geneontology.org/formats/oboInOwl#',
+    'RID': 'http://www.radlex.org/RID/'
+}
+
+OWL_CLASS = '{http://www.w3.org/2002/07/owl#}Class'
+
+# lxml keeps comments and processing instructions as children (their tag is not a string); drop them
+ITERPARSE_OPTIONS = {'remove_comments': True, 'remove_pis': True} if LXML_AVAILABLE else {}
+
+# Tags and attributes read from each owl:Class, in Clark notation so they compare as plain strings
+RDF_ABOUT = f"{{{NAMESPACES['rdf']}}}about"
+RDF_RESOURCE = f"{{{NAMESPACES['rdf']}}}resource"
+RDFS_SUBCLASS_OF = f"{{{NAMESPACES['rdfs']}}}subClassOf"
+SKOS_PREF_LABEL = f"{{{NAMESPACES['skos']}}}prefLabel"
+RID_PREFERRED_NAME = f"{{{NAMESPACES['RID']}}}Preferred_name"
+RID_DEFINITION = f"{{{NAMESPACES['RID']}}}Definition"
+RID_SYNONYM = f"{{{NAMESPACES['RID']}}}Synonym"
+RID_ACRONYM = f"{{{NAMESPACES['RID']}}}Acronym"
+
+# Children of which only the first is used
+FIRST_CHILD_TAGS = frozenset((RID_PREFERRED_NAME, RID_DEFINITION, RID_ACRONYM, SKOS_PREF_LABEL))
+
+# OWL/RDF system URIs (not RadLex terms)
+SYSTEM_URIS = ('http://www.w3.org', 'http://purl.org/dc')
+
+
+def _rid_from_uri(uri: str) -> str:
+    """Local name of a RadLex URI: the part after the last '/', then after the last '#'"""
+    return uri.rpartition('/')[2].rpartition('#')[2]
+
+
 class RadLexProcessor:
     """Process RadLex ontology into structured chunks"""
     
@@ -35,18 +81,18 @@ class RadLexProcessor:
         if not self.owl_file.exists():
             raise FileNotFoundError(f"RadLex OWL file not found: {self.owl_file}")
         
-        with open(self.owl_file, 'rb') as f:
-            owl_content = f.read()
-        
-        terms = self._parse_owl(owl_content)
+        terms = self._parse_owl(self.owl_file)
         print(f"   Parsed {len(terms):,} RadLex terms")
         
         return terms
     
-    def _parse_owl(self, owl_content: bytes) -> List[Dict]:
+    def _parse_owl(self, owl_file: Path) -> List[Dict]:
         """
         Parse OWL file to extract RadLex terms with hierarchy
         
+        Streams the file with iterparse and drops each top-level element once it is handled,
+        so memory stays flat however large the ontology is.
+        
         Preserves:
         - Term IDs and labels
         - Definitions
@@ -56,144 +102,25 @@ class RadLexProcessor:
         terms = []
         
         try:
-            root = ET.fromstring(owl_content)
-            
-            # Define namespaces
-            namespaces = {
-                'owl': 'http://www.w3.org/2002/07/owl#',
-                'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
-                'rdfs': 'http://www.w3.org/2000/01/rdf-schema#',
-                'skos': 'http://www.w3.org/2004/02/skos/core#',
-                'obo': 'http://purl.obolibrary.org/obo/',
-                'dc': 'http://purl.org/dc/elements/1.1/',
-                'oboInOwl': 'http://www.geneontology.org/formats/oboInOwl#',
-                'RID': 'http://www.radlex.org/RID/'
-            }
+            # Start events only track depth; the first one is the rdf:RDF root
+            context = ET.iterparse(str(owl_file), events=('start', 'end'), **ITERPARSE_OPTIONS)
+            _, root = next(context)
+            depth = 0
             
-            # Find all classes (terms)
-            owl_classes = (
-                root.findall('.//owl:Class', namespaces) or 
-                root.findall('.//{http://www.w3.org/2002/07/owl#}Class')
-            )
-            
-            for owl_class in owl_classes:
-                # Extract term ID/URI
-                term_id = (
-                    owl_class.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about') or
-                    owl_class.get('rdf:about') or
-                    ''
-                )
-                
-                # Skip OWL/RDF system classes
-                if not term_id or any(x in term_id for x in ['http://www.w3.org', 'http://purl.org/dc']):
+            for event, elem in context:
+                if event == 'start':
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth:
                     continue
                 
-                # Extract RID
-                rid = term_id.split('/')[-1] if '/' in term_id else term_id
-                rid = rid.split('#')[-1] if '#' in rid else rid
-                
-                # Get label - prioritize RadLex Preferred_name
-                label = ''
-                
-                # Try RadLex-specific Preferred_name
-                pref_name = owl_class.find('RID:Preferred_name', namespaces)
-                if pref_name is not None and pref_name.text:
-                    label = pref_name.text.strip()
-                
-                # Try without namespace prefix
-                if not label:
-                    for elem in owl_class:
-                        if 'Preferred_name' in elem.tag:
-                            if elem.text:
-                                label = elem.text.strip()
-                                break
-                
-                # Fallback to prefLabel
-                if not label:
-                    pref_label = owl_class.find('skos:prefLabel', namespaces)
-                    if pref_label is not None and pref_label.text:
-                        label = pref_label.text.strip()
-                
-                # Get definition
-                definition = ''
-                
-                # Try RadLex-specific Definition
-                def_elem = owl_class.find('RID:Definition', namespaces)
-                if def_elem is not None and def_elem.text:
-                    definition = def_elem.text.strip()
-                
-                # Try without namespace prefix
-                if not definition:
-                    for elem in owl_class:
-                        if 'Definition' in elem.tag:
-                            if elem.text:
-                                definition = elem.text.strip()
-                                break
-                
-                # Get synonyms
-                synonyms = []
-                
-                # Try RadLex-specific Synonym
-                for syn_elem in owl_class.findall('RID:Synonym', namespaces):
-                    if syn_elem.text:
-                        syn_text = syn_elem.text.strip()
-                        if syn_text and syn_text not in synonyms:
-                            synonyms.append(syn_text)
-                
-                # Also try Acronym as synonym
-                acronym_elem = owl_class.find('RID:Acronym', namespaces)
-                if acronym_elem is not None and acronym_elem.text:
-                    acronym = acronym_elem.text.strip()
-                    if acronym and acronym not in synonyms and acronym != label:
-                        synonyms.append(acronym)
-                
-                # Try without namespace prefix
-                for elem in owl_class:
-                    if 'Synonym' in elem.tag:
-                        if elem.text:
-                            syn_text = elem.text.strip()
-                            if syn_text and syn_text not in synonyms:
-                                synonyms.append(syn_text)
-                
-                # Get parent classes (hierarchy)
-                parents = []
-                for subclass_elem in owl_class.findall('.//rdfs:subClassOf', namespaces):
-                    parent_uri = (
-                        subclass_elem.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource') or
-                        subclass_elem.get('rdf:resource') or
-                        ''
-                    )
-                    if parent_uri:
-                        # Skip OWL system classes
-                        if any(x in parent_uri for x in ['http://www.w3.org', 'http://purl.org/dc']):
-                            continue
-                        parent_rid = parent_uri.split('/')[-1]
-                        parent_rid = parent_rid.split('#')[-1]
-                        if parent_rid and parent_rid not in parents:
-                            parents.append(parent_rid)
-                
-                # Also try direct namespace
-                for subclass_elem in owl_class.findall('.//{http://www.w3.org/2000/01/rdf-schema#}subClassOf'):
-                    parent_uri = subclass_elem.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource', '')
-                    if parent_uri:
-                        if any(x in parent_uri for x in ['http://www.w3.org', 'http://purl.org/dc']):
-                            continue
-                        parent_rid = parent_uri.split('/')[-1]
-                        parent_rid = parent_rid.split('#')[-1]
-                        if parent_rid and parent_rid not in parents:
-                            parents.append(parent_rid)
-                
-                # Only include terms with labels or valid RIDs
-                if label or (rid and rid.startswith('RID')):
-                    term = {
-                        'rid': rid,
-                        'label': label if label else rid,
-                        'definition': definition,
-                        'synonyms': synonyms,
-                        'parents': parents,
-                        'uri': term_id
-                    }
-                    terms.append(term)
+                # A complete top-level element: its classes (including nested ones) in document order
+                for owl_class in elem.iter(OWL_CLASS):
+                    term = self._parse_class(owl_class)
+                    if term:
+                        terms.append(term)
+                root.clear()
         
         except ET.ParseError as e:
             print(f"   ⚠️  Warning: XML parse error: {e}")
@@ -201,6 +128,124 @@ class RadLexProcessor:
         
         return terms
     
+    def _parse_class(self, owl_class) -> Optional[Dict]:
+        """Extract one RadLex term from an owl:Class element (None for system or unlabelled classes)"""
+        # Extract term ID/URI
+        term_id = owl_class.get(RDF_ABOUT, '')
+        
+        # Skip OWL/RDF system classes
+        if not term_id or any(x in term_id for x in SYSTEM_URIS):
+            return None
+        
+        # Extract RID
+        rid = _rid_from_uri(term_id)
+        
+        # One pass over the children, sorting them by tag (subClassOf is also looked for deeper down)
+        first = {}
+        rid_synonyms = []
+        any_name = any_definition = None
+        any_synonyms = []
+        subclass_elems = []
+        
+        for child in owl_class:
+            tag = child.tag
+            if tag in FIRST_CHILD_TAGS:
+                first.setdefault(tag, child)
+            elif tag == RID_SYNONYM:
+                rid_synonyms.append(child)
+            
+            # Tags matched without namespace prefix: the first one with text wins
+            text = child.text
+            if text:
+                if any_name is None and 'Preferred_name' in tag:
+                    any_name = text
+                if any_definition is None and 'Definition' in tag:
+                    any_definition = text
+                if 'Synonym' in tag:
+                    any_synonyms.append(text)
+            
+            if len(child):
+                subclass_elems.extend(child.iter(RDFS_SUBCLASS_OF))
+            elif tag == RDFS_SUBCLASS_OF:
+                subclass_elems.append(child)
+        
+        # Get label - prioritize RadLex Preferred_name
+        label = ''
+        
+        # Try RadLex-specific Preferred_name
+        pref_name = first.get(RID_PREFERRED_NAME)
+        if pref_name is not None and pref_name.text:
+            label = pref_name.text.strip()
+        
+        # Try without namespace prefix
+        if not label and any_name:
+            label = any_name.strip()
+        
+        # Fallback to prefLabel
+        if not label:
+            pref_label = first.get(SKOS_PREF_LABEL)
+            if pref_label is not None and pref_label.text:
+                label = pref_label.text.strip()
+        
+        # Get definition
+        definition = ''
+        
+        # Try RadLex-specific Definition
+        def_elem = first.get(RID_DEFINITION)
+        if def_elem is not None and def_elem.text:
+            definition = def_elem.text.strip()
+        
+        # Try without namespace prefix
+        if not definition and any_definition:
+            definition = any_definition.strip()
+        
+        # Get synonyms
+        synonyms = {}  # Used as an ordered set: each synonym kept once, in first-seen order
+        
+        # Try RadLex-specific Synonym
+        for syn_elem in rid_synonyms:
+            if syn_elem.text:
+                syn_text = syn_elem.text.strip()
+                if syn_text:
+                    synonyms[syn_text] = None
+        
+        # Also try Acronym as synonym
+        acronym_elem = first.get(RID_ACRONYM)
+        if acronym_elem is not None and acronym_elem.text:
+            acronym = acronym_elem.text.strip()
+            if acronym and acronym != label:
+                synonyms[acronym] = None
+        
+        # Try without namespace prefix
+        for text in any_synonyms:
+            syn_text = text.strip()
+            if syn_text:
+                synonyms[syn_text] = None
+        
+        # Get parent classes (hierarchy)
+        parents = {}  # Ordered set, as for synonyms
+        for subclass_elem in subclass_elems:
+            parent_uri = subclass_elem.get(RDF_RESOURCE, '')
+            if parent_uri:
+                # Skip OWL system classes
+                if any(x in parent_uri for x in SYSTEM_URIS):
+                    continue
+                parent_rid = _rid_from_uri(parent_uri)
+                if parent_rid:
+                    parents[parent_rid] = None
+        
+        # Only include terms with labels or valid RIDs
+        if label or (rid and rid.startswith('RID')):
+            return {
+                'rid': rid,
+                'label': label if label else rid,
+                'definition': definition,
+                'synonyms': list(synonyms),
+                'parents': list(parents),
+                'uri': term_id
+            }
+        return None
+    
     def process(self) -> List[Chunk]:
         """
         Process RadLex into chunks.